@@ -1,20 +1,31 @@
 #!/usr/bin/env python3
+import atexit
 import os
 import fnmatch
+import heapq
 import json
+import logging
 import csv
+import multiprocessing
 import re
 import base64
 import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import count, repeat
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import List, Tuple, Dict, Any, Optional
+from functools import lru_cache
+from typing import Callable, Deque, FrozenSet, List, Tuple, Dict, Any, Optional
 
 try:
     from fastapi import FastAPI, Depends, HTTPException, Request
     from fastapi.exceptions import RequestValidationError
     from fastapi.responses import JSONResponse
     from fastapi.middleware.cors import CORSMiddleware
+    from fastapi.middleware.gzip import GZipMiddleware
 except ModuleNotFoundError:  # pragma: no cover - test/runtime fallback when fastapi is unavailable
     class HTTPException(Exception):
         def __init__(self, status_code: int = 500, detail: Any = None):
@@ -60,6 +71,22 @@ except ModuleNotFoundError:  # pragma: no cover - test/runtime fallback when fas
     class CORSMiddleware:
         pass
 
+    class GZipMiddleware:
+        pass
+
+# Optional fast JSON codec; stdlib json is used when orjson is not installed.
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # type: ignore
+
+
+class _OrjsonResponse(JSONResponse):
+    # FastAPI's own ORJSONResponse is deprecated and warns on every use.
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 # ----------------------------
 # Config (ENV)
 # ----------------------------
@@ -71,6 +98,16 @@ DEFAULT_PULL_LIMIT = int(os.getenv("DEFAULT_PULL_LIMIT", "500"))
 MAX_PULL_LIMIT = int(os.getenv("MAX_PULL_LIMIT", "2000"))
 RECENT_PULL_MAX_FILES = int(os.getenv("RECENT_PULL_MAX_FILES", "32"))
 RECENT_PULL_MAX_AGE_HOURS = int(os.getenv("RECENT_PULL_MAX_AGE_HOURS", "48"))
+# Accounting files are scanned sequentially; a large buffer amortizes read syscalls.
+READ_BUFFER_BYTES = int(os.getenv("READ_BUFFER_BYTES", str(1 << 20)))
+# Worker processes for full accounting scans (job counts/outcomes); 1 keeps them in-process.
+ACCOUNTING_SCAN_WORKERS = max(1, int(os.getenv("ACCOUNTING_SCAN_WORKERS", "1")))
+# Job scans log the first unclassified-outcome row and then one in every N.
+UNKNOWN_OUTCOME_LOG_EVERY = max(1, int(os.getenv("UNKNOWN_OUTCOME_LOG_EVERY", "1000")))
+# Directory listings for /files and job scans are reused this long; 0 disables reuse.
+DIR_LISTING_TTL_SECONDS = float(os.getenv("DIR_LISTING_TTL_SECONDS", "1"))
+# Responses above this size are gzip-compressed for clients that send Accept-Encoding: gzip.
+GZIP_MIN_BYTES = int(os.getenv("GZIP_MIN_BYTES", "1024"))
 
 # CORS (for browser access)
 # Examples:
@@ -84,7 +121,12 @@ CORS_ORIGINS = (
 # ----------------------------
 # App
 # ----------------------------
-app = FastAPI(title="PMTA Accounting/Logs API", version="1.0.0")
+# Outcome payloads can hold 10^5+ recipient strings; orjson renders them much faster.
+app = FastAPI(
+    title="PMTA Accounting/Logs API",
+    version="1.0.0",
+    default_response_class=_OrjsonResponse if orjson is not None else JSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -93,6 +135,8 @@ app.add_middleware(
     allow_methods=["GET", "POST", "OPTIONS"],
     allow_headers=["*"],
 )
+# Outcome payloads repeat the same keys on every event and compress very well.
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MIN_BYTES)
 
 ALLOWED_KINDS = {
     "acct": ["acct-*.csv"],
@@ -104,8 +148,33 @@ ALLOWED_KINDS = {
 
 _TAIL_STATE_LOCK = threading.Lock()
 _TAIL_STATE: Dict[str, int] = {}
+_Row = Tuple[str, str, str, str, str]
+_Bucket = Dict[str, _Row]
+_Winners = Dict[str, _Bucket]
+_Fingerprint = Tuple[Tuple[str, int, int, int], ...]
+_Listing = List[Tuple[str, str, os.stat_result]]
+# path -> (inode, size, mtime_ns, head, (job id, details) -> (offset, winners before offset))
+_ScanState = Tuple[int, int, int, bytes, Dict[Tuple[str, bool], Tuple[int, _Bucket]]]
+_JOB_SCAN_STATE_LOCK = threading.Lock()
+_JOB_SCAN_STATE: "OrderedDict[str, _ScanState]" = OrderedDict()
+_JOB_SCAN_STATE_MAX = 1024
+_JOB_SCAN_JOBS_MAX = 256
+_JOB_SCAN_HEAD_BYTES = 4096
+# (job ids, details) -> (files fingerprint, merged winners) of the latest scan
+_JOB_RESULT_LOCK = threading.Lock()
+_JOB_RESULT_CACHE: "OrderedDict[Tuple[Tuple[str, ...], bool], Tuple[_Fingerprint, _Winners]]" = OrderedDict()
+_JOB_RESULT_CACHE_MAX = 64
+# Worker pool for ACCOUNTING_SCAN_WORKERS > 1, created on first use
+_SCAN_POOL_LOCK = threading.Lock()
+_SCAN_POOL: Optional[ProcessPoolExecutor] = None
+# (log dir, patterns) -> (monotonic time, scan result); see _listed_matching_files.
+_DIR_LISTING_LOCK = threading.Lock()
+_DIR_LISTING_CACHE: Dict[Tuple[str, Tuple[str, ...]], Tuple[float, _Listing]] = {}
 _CSV_HEADER_STATE_LOCK = threading.Lock()
 _CSV_HEADER_STATE: Dict[str, List[str]] = {}
+# file -> "json" or CSV delimiter; dropped when a file is read from byte 0 (guarded by _CSV_HEADER_STATE_LOCK)
+_LINE_FORMAT_STATE: Dict[str, str] = {}
+# Writers swap in a new dict under the lock; /status reads the current one lock-free.
 _BRIDGE_STATUS_LOCK = threading.Lock()
 _BRIDGE_STATUS: Dict[str, Any] = {
     "last_processed_file": "",
@@ -117,9 +186,20 @@ _BRIDGE_STATUS: Dict[str, Any] = {
 }
 
 
+# Bound once so per-row NDJSON decoding calls the decoder directly.
+_json_loads: Callable[[Any], Any] = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps_bytes(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
 def _status_update(**kwargs: Any) -> None:
+    global _BRIDGE_STATUS
     with _BRIDGE_STATUS_LOCK:
-        _BRIDGE_STATUS.update(kwargs)
+        _BRIDGE_STATUS = {**_BRIDGE_STATUS, **kwargs}
 
 
 def _error_payload(error: str, detail: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -172,20 +252,24 @@ _PMTA_MESSAGE_ID_RE = re.compile(
     re.IGNORECASE,
 )
 
-_JOBID_RE_1 = re.compile(r"[.][a-f0-9]{8,64}[.]([a-f0-9]{12})[.]([a-f0-9]{8,64}|none)[.]c[0-9]+[.]w[0-9]+@local", re.IGNORECASE)
-_JOBID_RE_2 = re.compile(r"[.][a-f0-9]{8,64}[.]([a-f0-9]{12})[.]c[0-9]+[.]w[0-9]+@local", re.IGNORECASE)
+# The campaign segment is optional: <uuid.<job_id>[.<campaign_id>|.none].c<chunk>.w<worker>@local>
+_JOBID_RE = re.compile(
+    r"[.][a-f0-9]{8,64}[.]([a-f0-9]{12})(?:[.](?:[a-f0-9]{8,64}|none))?[.]c[0-9]+[.]w[0-9]+@local",
+    re.IGNORECASE,
+)
+_HEX12_FULL_RE = re.compile(r"[a-f0-9]{12}")
+_HEX12_WORD_RE = re.compile(r"\b([a-f0-9]{12})\b")
 
 
 def _extract_job_id_from_text(text: str) -> str:
-    t = str(text or "").strip().lower()
-    if not t:
+    # _JOBID_RE is case-insensitive, so only the 12-char match is lowered, not the text.
+    t = text if type(text) is str else str(text or "")
+    # Every match ends in "@local"; text without an "@" is rejected by one C-level scan.
+    if "@" not in t:
         return ""
-    m = _JOBID_RE_1.search(t)
-    if m:
-        return str(m.group(1) or "").strip().lower()
-    m = _JOBID_RE_2.search(t)
+    m = _JOBID_RE.search(t)
     if m:
-        return str(m.group(1) or "").strip().lower()
+        return m.group(1).lower()
     return ""
 
 
@@ -196,7 +280,7 @@ def _parse_ids_from_message_id(value: Any) -> Tuple[str, str]:
     m = _PMTA_MESSAGE_ID_RE.match(msgid)
     if not m:
         return "", ""
-    return str(m.group(1) or "").strip().lower(), str(m.group(2) or "").strip().lower()
+    return m.group(1).lower(), m.group(2).lower()
 
 
 def _normalize_job_id(value: Any) -> str:
@@ -204,83 +288,153 @@ def _normalize_job_id(value: Any) -> str:
     raw = str(value or "").strip().lower()
     if not raw:
         return ""
-    if re.fullmatch(r"[a-f0-9]{12}", raw):
+    if _HEX12_FULL_RE.fullmatch(raw):
         return raw
 
     from_text = _extract_job_id_from_text(raw)
     if from_text:
         return from_text
 
-    m = re.search(r"\b([a-f0-9]{12})\b", raw)
+    m = _HEX12_WORD_RE.search(raw)
     if m:
-        return str(m.group(1) or "").strip().lower()
+        return m.group(1)
     return raw
 
 
+_OUTCOME_TYPE_EXACT: Dict[str, str] = {
+    **{k: "delivered" for k in ("d", "delivered", "delivery", "success", "accepted", "ok", "sent")},
+    **{
+        k: "bounced"
+        for k in ("b", "bounce", "bounced", "hardbounce", "softbounce", "failed", "failure", "reject", "rejected", "error")
+    },
+    **{k: "deferred" for k in ("t", "defer", "deferred", "deferral", "transient")},
+    **{k: "complained" for k in ("c", "complaint", "complained", "fbl")},
+}
+
+
+# Substring probes for free-form status text, one alternation per outcome (checked in order).
+_OUT_DELIV_RE = re.compile("|".join(map(re.escape, ("success", "2.0.0", "relayed", "delivered", "accepted", "250 "))))
+_OUT_BOUNCE_RE = re.compile(
+    "|".join(map(re.escape, ("bounce", "bounced", "failed", "failure", "reject", "5.", " 550", " 551", " 552", " 553", " 554")))
+)
+_OUT_DEFER_RE = re.compile("|".join(map(re.escape, ("defer", "deferred", "transient", "4.", " 421", " 450", " 451", " 452"))))
+_OUT_COMPL_RE = re.compile("|".join(map(re.escape, ("complaint", "fbl", "abuse"))))
+
+
 def _normalize_outcome_type(v: Any) -> str:
     s = str(v or "").strip().lower()
     if not s:
         return ""
-    if s in {"d", "delivered", "delivery", "success", "accepted", "ok", "sent"}:
+    exact = _OUTCOME_TYPE_EXACT.get(s)
+    if exact:
+        return exact
+    if _OUT_DELIV_RE.search(s):
         return "delivered"
-    if s in {"b", "bounce", "bounced", "hardbounce", "softbounce", "failed", "failure", "reject", "rejected", "error"}:
+    if _OUT_BOUNCE_RE.search(s):
         return "bounced"
-    if s in {"t", "defer", "deferred", "deferral", "transient"}:
+    if _OUT_DEFER_RE.search(s):
         return "deferred"
-    if s in {"c", "complaint", "complained", "fbl"}:
-        return "complained"
-    if any(x in s for x in ("success", "2.0.0", "relayed", "delivered", "accepted", "250 ")):
-        return "delivered"
-    if any(x in s for x in ("bounce", "bounced", "failed", "failure", "reject", "5.", " 550", " 551", " 552", " 553", " 554")):
-        return "bounced"
-    if any(x in s for x in ("defer", "deferred", "transient", "4.", " 421", " 450", " 451", " 452")):
-        return "deferred"
-    if any(x in s for x in ("complaint", "fbl", "abuse")):
+    if _OUT_COMPL_RE.search(s):
         return "complained"
     return ""
 
 
-def _event_value(ev: Dict[str, Any], *names: str) -> str:
-    aliases = {str(n or "").strip().lower().replace("_", "-") for n in names if str(n or "").strip()}
-    if not aliases:
+@lru_cache(maxsize=1024)
+def _norm_key(key: str) -> str:
+    """Normalize an event field name; field names repeat across rows so results are memoized."""
+    return str(key or "").strip().lower().replace("_", "-")
+
+
+@lru_cache(maxsize=256)
+def _alias_set(names: Tuple[str, ...]) -> FrozenSet[str]:
+    """Normalized alias set for one `_event_value` call signature (callers pass constant names)."""
+    return frozenset(_norm_key(n) for n in names if str(n or "").strip())
+
+
+@lru_cache(maxsize=1024)
+def _field_plan(keys: Tuple[str, ...], names: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Candidate keys for one `_event_value` lookup per (key layout, names), exact matches first."""
+    aliases = _alias_set(names)
+    normed = [(k, _norm_key(k)) for k in keys]
+    exact = [k for k, kk in normed if kk in aliases]
+    fuzzy = [k for k, kk in normed if any(a in kk for a in aliases)]
+    return tuple(exact + fuzzy)
+
+
+class _KeyLayout:
+    """Field plans of one event key layout, worked out as `_EventIndex.value` asks for names."""
+
+    __slots__ = ("keys", "_plans")
+
+    def __init__(self, keys: Tuple[str, ...]):
+        self.keys = keys
+        self._plans: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+    def plan(self, names: Tuple[str, ...]) -> Tuple[str, ...]:
+        plan = self._plans.get(names)
+        if plan is None:
+            plan = self._plans[names] = _field_plan(self.keys, names)
+        return plan
+
+
+@lru_cache(maxsize=256)
+def _key_layout(keys: Tuple[str, ...]) -> _KeyLayout:
+    """Shared `_KeyLayout` of a key tuple, so each row hashes its layout once, not per field."""
+    return _KeyLayout(keys)
+
+
+class _EventIndex:
+    """One event prepared for many `_event_value` lookups through cached field plans."""
+
+    __slots__ = ("ev", "layout")
+
+    def __init__(self, ev: Dict[str, Any]):
+        self.ev = ev or {}
+        self.layout = _key_layout(tuple(self.ev))
+
+    def value(self, *names: str) -> str:
+        ev = self.ev
+        for k in self.layout.plan(names):
+            vv = str(ev[k] or "").strip()
+            if vv:
+                return vv
         return ""
-    for k, v in (ev or {}).items():
-        kk = str(k or "").strip().lower().replace("_", "-")
-        vv = str(v or "").strip()
-        if kk in aliases and vv:
-            return vv
-    for k, v in (ev or {}).items():
-        kk = str(k or "").strip().lower().replace("_", "-")
-        vv = str(v or "").strip()
-        if vv and any(a in kk for a in aliases):
-            return vv
-    return ""
+
+
+def _event_index(ev: Any) -> _EventIndex:
+    return ev if isinstance(ev, _EventIndex) else _EventIndex(ev)
+
+
+def _event_value(ev: Any, *names: str) -> str:
+    """First non-empty field of ``ev`` (a dict or `_EventIndex`) matching one of ``names``."""
+    return _event_index(ev).value(*names)
 
 
 def _event_job_id(ev: Dict[str, Any]) -> str:
-    jid = _event_value(ev, "header_x-job-id", "x-job-id")
+    idx = _event_index(ev)
+    jid = idx.value("header_x-job-id", "x-job-id")
     jid = _normalize_job_id(jid)
     if jid:
         return jid
-    msgid = _event_value(ev, "header_message-id", "message-id", "message_id", "msgid", "messageid")
+    msgid = idx.value("header_message-id", "message-id", "message_id", "msgid", "messageid")
     jid, _ = _parse_ids_from_message_id(msgid)
     jid = _normalize_job_id(jid)
     if jid:
         return jid
 
     # PMTA columns can exist but are often empty in acct files; keep as last fallback only.
-    jid = _normalize_job_id(_event_value(ev, "job-id", "job_id", "jobid", "envid", "env-id"))
+    jid = _normalize_job_id(idx.value("job-id", "job_id", "jobid", "envid", "env-id"))
     if jid:
         return jid
     return ""
 
 
 def _event_campaign_id(ev: Dict[str, Any]) -> str:
-    campaign_id = _event_value(ev, "header_x-campaign-id", "x-campaign-id")
-    campaign_id = str(campaign_id or "").strip().lower()
+    idx = _event_index(ev)
+    campaign_id = idx.value("header_x-campaign-id", "x-campaign-id").lower()
     if campaign_id:
         return campaign_id
-    msgid = _event_value(ev, "header_message-id", "message-id", "message_id", "msgid", "messageid")
+    msgid = idx.value("header_message-id", "message-id", "message_id", "msgid", "messageid")
     _, campaign_id = _parse_ids_from_message_id(msgid)
     return campaign_id
 
@@ -291,99 +445,137 @@ def _event_explicit_job_id(ev: Dict[str, Any]) -> str:
     return _normalize_job_id(jid)
 
 
-def _walk_accounting_events(patterns: List[str]):
-    files = _find_matching_files(patterns)
-    for fp in files:
-        with fp.open("r", encoding="utf-8", errors="replace") as f:
-            for line_no, line in enumerate(f, start=1):
-                s = (line or "").strip()
-                if not s:
-                    continue
-                ev = _parse_accounting_line(s, source_file=fp.name, line_no_or_offset=line_no)
-                if ev:
-                    yield ev
-
-
 def require_token(_: Request):
     """Bridge API is intentionally open; no token/auth is required."""
     return None
 
 
-def _file_matches(name: str, patterns: List[str]) -> bool:
-    return any(fnmatch.fnmatch(name, pat) for pat in patterns)
+@lru_cache(maxsize=64)
+def _compile_patterns(patterns: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Fold a glob list into one alternation regex, compiled once per pattern tuple."""
+    if not patterns:
+        return re.compile(r"(?!)")
+    return re.compile("|".join("(?:%s)" % fnmatch.translate(pat) for pat in patterns))
 
 
-def list_dir_files(patterns: List[str]) -> List[Dict[str, Any]]:
-    if not PMTA_LOG_DIR.is_dir():
-        raise HTTPException(status_code=500, detail=f"Directory not found: {PMTA_LOG_DIR}")
+@lru_cache(maxsize=64)
+def _pattern_matcher(patterns: Tuple[str, ...]) -> Callable[[str], bool]:
+    """Return a name predicate that checks each glob's literal prefix/suffix before the regex."""
+    regex_match = _compile_patterns(patterns).match
+    # Patterns with a "[...]" class are not screened and go straight to the regex.
+    parts = [[""] if "[" in pat else re.split(r"[*?]", pat) for pat in patterns]
+    prefixes = tuple(p[0] for p in parts)
+    suffixes = tuple(p[-1] for p in parts)
 
-    items = []
-    for p in PMTA_LOG_DIR.iterdir():
-        try:
-            if p.is_symlink():
+    def match(name: str) -> bool:
+        return name.startswith(prefixes) and name.endswith(suffixes) and regex_match(name) is not None
+
+    return match
+
+
+def _file_matches(name: str, patterns: List[str]) -> bool:
+    return _pattern_matcher(tuple(patterns))(name)
+
+
+def _scan_matching_files(patterns: List[str]) -> _Listing:
+    """Return (name, path, stat) for regular files in PMTA_LOG_DIR matching patterns."""
+    matcher = _pattern_matcher(tuple(patterns))
+    found: _Listing = []
+    with os.scandir(PMTA_LOG_DIR) as it:
+        for entry in it:
+            name = entry.name
+            if not matcher(name):
                 continue
-            if not p.is_file():
+            try:
+                if entry.is_symlink() or not entry.is_file(follow_symlinks=False):
+                    continue
+                st = entry.stat(follow_symlinks=False)
+            except FileNotFoundError:
+                # file rotated/deleted between scandir and stat
                 continue
+            found.append((name, entry.path, st))
+    return found
 
-            name = p.name
-            if not _file_matches(name, patterns):
-                continue
 
-            st = p.stat()
-            mtime = st.st_mtime
+@lru_cache(maxsize=4096)
+def _format_mtimes(mtime: float) -> Tuple[str, str]:
+    """(UTC, local) ISO strings for an mtime; unchanged files repeat across listings."""
+    return (
+        datetime.fromtimestamp(mtime, tz=timezone.utc).isoformat(),
+        datetime.fromtimestamp(mtime).astimezone().isoformat(),
+    )
 
-            items.append(
-                {
-                    "name": name,
-                    "size_bytes": int(st.st_size),
-                    "mtime_epoch": int(mtime),
-                    "mtime_utc": datetime.fromtimestamp(mtime, tz=timezone.utc).isoformat(),
-                    "mtime_local": datetime.fromtimestamp(mtime).astimezone().isoformat(),
-                }
-            )
-        except FileNotFoundError:
-            # file rotated/deleted between iterdir and stat
-            continue
+
+def _advise_sequential(f: Any) -> None:
+    """Tell the kernel ``f`` is read front to back so it widens readahead (POSIX only)."""
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+
+def _listed_matching_files(patterns: List[str]) -> _Listing:
+    """``_scan_matching_files`` reused for DIR_LISTING_TTL_SECONDS; the shared list must not be mutated."""
+    ttl = DIR_LISTING_TTL_SECONDS
+    if ttl <= 0:
+        return _scan_matching_files(patterns)
+    key = (str(PMTA_LOG_DIR), tuple(patterns))
+    now = time.monotonic()
+    with _DIR_LISTING_LOCK:
+        cached = _DIR_LISTING_CACHE.get(key)
+    if cached is not None and now - cached[0] < ttl:
+        return cached[1]
+    found = _scan_matching_files(patterns)
+    with _DIR_LISTING_LOCK:
+        if len(_DIR_LISTING_CACHE) >= 64:
+            _DIR_LISTING_CACHE.clear()
+        _DIR_LISTING_CACHE[key] = (now, found)
+    return found
+
+
+def _drop_dir_listing() -> None:
+    """Forget cached listings once a listed file turns out to be gone."""
+    with _DIR_LISTING_LOCK:
+        _DIR_LISTING_CACHE.clear()
+
+
+def list_dir_files(patterns: List[str]) -> List[Dict[str, Any]]:
+    if not PMTA_LOG_DIR.is_dir():
+        raise HTTPException(status_code=500, detail=f"Directory not found: {PMTA_LOG_DIR}")
+
+    items = []
+    for name, _, st in _listed_matching_files(patterns):
+        mtime = st.st_mtime
+        mtime_utc, mtime_local = _format_mtimes(mtime)
+        items.append(
+            {
+                "name": name,
+                "size_bytes": int(st.st_size),
+                "mtime_epoch": int(mtime),
+                "mtime_utc": mtime_utc,
+                "mtime_local": mtime_local,
+            }
+        )
 
     return items
 
 
 def _find_matching_files(patterns: List[str]) -> List[Path]:
-    candidates: List[Tuple[float, Path]] = []
-    for p in PMTA_LOG_DIR.iterdir():
-        if not p.is_file() or p.is_symlink():
-            continue
-        if not _file_matches(p.name, patterns):
-            continue
-        try:
-            candidates.append((p.stat().st_mtime, p))
-        except FileNotFoundError:
-            continue
-
+    candidates = [(st.st_mtime, path) for _, path, st in _listed_matching_files(patterns)]
     if not candidates:
         raise HTTPException(status_code=404, detail="No accounting/log files matched")
 
     candidates.sort(key=lambda x: x[0], reverse=True)
-    return [p for _, p in candidates]
+    return [Path(path) for _, path in candidates]
 
 
 def _find_latest_file(patterns: List[str]) -> Path:
-    candidates: List[Tuple[float, Path]] = []
-    for p in PMTA_LOG_DIR.iterdir():
-        if not p.is_file() or p.is_symlink():
-            continue
-        if not _file_matches(p.name, patterns):
-            continue
-        try:
-            candidates.append((p.stat().st_mtime, p))
-        except FileNotFoundError:
-            continue
-
+    candidates = [(st.st_mtime, path) for _, path, st in _listed_matching_files(patterns)]
     if not candidates:
         raise HTTPException(status_code=404, detail="No accounting/log files matched")
 
-    candidates.sort(key=lambda x: x[0], reverse=True)
-    return candidates[0][1]
+    return Path(max(candidates, key=lambda x: x[0])[1])
 
 
 def _read_new_lines(path: Path, max_lines: int) -> Dict[str, Any]:
@@ -430,50 +622,51 @@ def _read_new_lines(path: Path, max_lines: int) -> Dict[str, Any]:
     }
 
 
-def _parse_accounting_line(
-    line: str,
-    *,
-    source_file: str = "",
-    line_no_or_offset: Any = "",
-) -> Optional[Dict[str, Any]]:
-    """Parse accounting line into dict (best-effort).
+def _split_fields(s: str, delim: str) -> List[str]:
+    """Split one accounting row into stripped fields; the csv reader is only used for quoted rows."""
+    if '"' not in s:
+        return [x.strip() for x in s.split(delim)]
+    return [x.strip() for x in next(csv.reader([s], delimiter=delim))]
 
-    Supports JSON lines and CSV files with/without header rows.
-    """
-    s = (line or "").strip()
-    if not s:
-        return None
-
-    if s.startswith("{") and s.endswith("}"):
-        try:
-            obj = json.loads(s)
-            if isinstance(obj, dict):
-                obj.setdefault("source_file", source_file)
-                obj.setdefault("line_no_or_offset", line_no_or_offset)
-                return obj
-        except Exception:
-            return None
 
-    delim = ","
+def _detect_delimiter(s: str) -> str:
     if "\t" in s and s.count("\t") >= s.count(","):
-        delim = "\t"
-    elif ";" in s and s.count(";") > s.count(","):
-        delim = ";"
+        return "\t"
+    if ";" in s and s.count(";") > s.count(","):
+        return ";"
+    return ","
 
+
+_CSV_HEADER_FIELDS = frozenset({"type", "event", "rcpt", "recipient", "msgid", "message-id", "message_id"})
+
+
+def _parse_json_line(s: str, source_file: str, line_no_or_offset: Any) -> Optional[Dict[str, Any]]:
+    """Parse one NDJSON object row (caller checks the ``{...}`` shape)."""
     try:
-        fields = next(csv.reader([s], delimiter=delim))
-        fields = [x.strip() for x in fields]
+        obj = _json_loads(s)
     except Exception:
         return None
+    if not isinstance(obj, dict):
+        return None
+    obj.setdefault("source_file", source_file)
+    obj.setdefault("line_no_or_offset", line_no_or_offset)
+    return obj
 
-    if fields and any(x.lower() in {"type", "event", "rcpt", "recipient", "msgid", "message-id", "message_id"} for x in fields):
+
+def _parse_csv_fields(
+    fields: List[str],
+    raw: str,
+    hdr: List[str],
+    source_file: str,
+    line_no_or_offset: Any,
+) -> Optional[Dict[str, Any]]:
+    """Map already-split CSV fields onto an event, recording header rows for ``source_file``."""
+    if fields and not _CSV_HEADER_FIELDS.isdisjoint(map(str.lower, fields)):
         with _CSV_HEADER_STATE_LOCK:
             _CSV_HEADER_STATE[source_file or ""] = [x.strip().lower() for x in fields]
         return None
 
-    ev: Dict[str, Any] = {"raw": s, "source_file": source_file, "line_no_or_offset": line_no_or_offset}
-    with _CSV_HEADER_STATE_LOCK:
-        hdr = _CSV_HEADER_STATE.get(source_file or "") or []
+    ev: Dict[str, Any] = {"raw": raw, "source_file": source_file, "line_no_or_offset": line_no_or_offset}
 
     if hdr and len(hdr) == len(fields):
         for k, v in zip(hdr, fields):
@@ -492,14 +685,63 @@ def _parse_accounting_line(
     return ev
 
 
-def _normalized_outcome(ev: Dict[str, Any]) -> str:
-    typ = str(_event_value(ev, "type") or "").strip().lower()
-    dsn_action = str(_event_value(ev, "dsnAction", "dsn_action") or "").strip().lower()
-    dsn_status = str(_event_value(ev, "dsnStatus", "dsn_status") or "").strip().lower()
-    dsn_diag = str(_event_value(ev, "dsnDiag", "dsn_diag") or "").strip().lower()
+def _forget_line_format(source_file: str) -> None:
+    """Drop the detected line format of a file read from byte 0; it may have been rotated."""
+    with _CSV_HEADER_STATE_LOCK:
+        _LINE_FORMAT_STATE.pop(source_file or "", None)
+
+
+def _parse_accounting_line(
+    line: str,
+    *,
+    source_file: str = "",
+    line_no_or_offset: Any = "",
+) -> Optional[Dict[str, Any]]:
+    """Parse accounting line into dict (best-effort).
 
-    if any(x in dsn_diag for x in ("complaint", "fbl", "feedback loop", "abuse")):
+    Supports JSON lines and CSV files with/without header rows.
+    """
+    s = (line or "").strip()
+    if not s:
+        return None
+
+    key = source_file or ""
+    # Lock-free read: writers only replace whole values under the lock.
+    fmt = _LINE_FORMAT_STATE.get(key)
+    hdr = _CSV_HEADER_STATE.get(key) or []
+    if fmt is None:
+        # Decided once per accounting file; free-form logs keep per-line detection.
+        fmt = "json" if s.startswith("{") else _detect_delimiter(s)
+        if key.lower().endswith(".csv"):
+            with _CSV_HEADER_STATE_LOCK:
+                _LINE_FORMAT_STATE[key] = fmt
+
+    if fmt == "json":
+        if s.startswith("{") and s.endswith("}"):
+            return _parse_json_line(s, source_file, line_no_or_offset)
+        delim = _detect_delimiter(s)
+    else:
+        delim = fmt
+
+    try:
+        fields = _split_fields(s, delim)
+    except Exception:
+        return None
+    return _parse_csv_fields(fields, s, hdr, source_file, line_no_or_offset)
+
+
+_COMPLAINT_DIAG_RE = re.compile("complaint|fbl|feedback loop|abuse", re.IGNORECASE)
+
+
+def _normalized_outcome(ev: Dict[str, Any]) -> str:
+    # Values are already stripped; the long diag text is matched case-insensitively, not lowered.
+    idx = _event_index(ev)
+    if _COMPLAINT_DIAG_RE.search(idx.value("dsnDiag", "dsn_diag")):
         return "complained"
+    typ = idx.value("type").lower()
+    dsn_action = idx.value("dsnAction", "dsn_action").lower()
+    dsn_status = idx.value("dsnStatus", "dsn_status")
+
     if typ == "d" or dsn_action == "relayed" or dsn_status.startswith("2"):
         return "delivered"
     if typ == "t" or dsn_action == "delayed" or dsn_status.startswith("4"):
@@ -510,23 +752,25 @@ def _normalized_outcome(ev: Dict[str, Any]) -> str:
 
 
 def _structured_event(ev: Dict[str, Any]) -> Dict[str, Any]:
-    message_id = _event_value(ev, "header_message-id", "message-id", "message_id", "msgid", "messageid")
+    idx = _event_index(ev)
+    ev = idx.ev
+    message_id = idx.value("header_message-id", "message-id", "message_id", "msgid", "messageid")
     return {
-        "type": str(_event_value(ev, "type") or "").strip().lower(),
-        "outcome": _normalized_outcome(ev),
-        "time_logged": _event_value(ev, "timeLogged", "timelogged", "time_logged", "time"),
-        "orig": _event_value(ev, "orig", "mailfrom", "from"),
-        "rcpt": _event_value(ev, "rcpt", "recipient", "email", "to", "rcpt_to"),
-        "job_id": _event_job_id(ev),
-        "campaign_id": _event_campaign_id(ev),
+        "type": idx.value("type").lower(),
+        "outcome": _normalized_outcome(idx),
+        "time_logged": idx.value("timeLogged", "timelogged", "time_logged", "time"),
+        "orig": idx.value("orig", "mailfrom", "from"),
+        "rcpt": idx.value("rcpt", "recipient", "email", "to", "rcpt_to"),
+        "job_id": _event_job_id(idx),
+        "campaign_id": _event_campaign_id(idx),
         "message_id": message_id,
-        "dsn_action": _event_value(ev, "dsnAction", "dsn_action"),
-        "dsn_status": _event_value(ev, "dsnStatus", "dsn_status"),
-        "dsn_diag": _event_value(ev, "dsnDiag", "dsn_diag"),
-        "vmta": _event_value(ev, "vmta"),
-        "dlv_source_ip": _event_value(ev, "dlvSourceIp", "dlv_source_ip"),
-        "dlv_dest_ip": _event_value(ev, "dlvDestinationIp", "dlv_dest_ip", "dlvDestinationIP"),
-        "bounce_cat": _event_value(ev, "bounceCat", "bounce_cat"),
+        "dsn_action": idx.value("dsnAction", "dsn_action"),
+        "dsn_status": idx.value("dsnStatus", "dsn_status"),
+        "dsn_diag": idx.value("dsnDiag", "dsn_diag"),
+        "vmta": idx.value("vmta"),
+        "dlv_source_ip": idx.value("dlvSourceIp", "dlv_source_ip"),
+        "dlv_dest_ip": idx.value("dlvDestinationIp", "dlv_dest_ip", "dlvDestinationIP"),
+        "bounce_cat": idx.value("bounceCat", "bounce_cat"),
         "source_file": str(ev.get("source_file") or ""),
         "line_no_or_offset": ev.get("line_no_or_offset", ""),
     }
@@ -728,14 +972,14 @@ def _request_filters(request: Request) -> Dict[str, str]:
 
 
 def _encode_cursor(payload: Dict[str, Any]) -> str:
-    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    raw = _json_dumps_bytes(payload)
     return base64.urlsafe_b64encode(raw).decode("ascii")
 
 
 def _decode_cursor(cursor: str) -> Dict[str, Any]:
     try:
         data = base64.urlsafe_b64decode(str(cursor or "").encode("ascii"))
-        decoded = json.loads(data.decode("utf-8"))
+        decoded = _json_loads(data)
     except Exception as exc:
         raise HTTPException(status_code=400, detail={"error": "invalid_cursor", "message": str(exc)})
 
@@ -748,19 +992,14 @@ def _recent_matching_files(patterns: List[str]) -> List[Dict[str, Any]]:
     now = datetime.now(timezone.utc).timestamp()
     min_mtime = now - max(1, RECENT_PULL_MAX_AGE_HOURS) * 3600
     files: List[Dict[str, Any]] = []
-    for p in PMTA_LOG_DIR.iterdir():
-        if not p.is_file() or p.is_symlink() or not _file_matches(p.name, patterns):
-            continue
-        try:
-            st = p.stat()
-        except FileNotFoundError:
-            continue
+    real_dir = os.path.realpath(PMTA_LOG_DIR)
+    for name, _, st in _scan_matching_files(patterns):
         if st.st_mtime < min_mtime:
             continue
         files.append(
             {
-                "path": str(p.resolve()),
-                "name": p.name,
+                "path": os.path.join(real_dir, name),
+                "name": name,
                 "inode": int(st.st_ino),
                 "size": int(st.st_size),
                 "mtime": float(st.st_mtime),
@@ -770,8 +1009,10 @@ def _recent_matching_files(patterns: List[str]) -> List[Dict[str, Any]]:
     if not files:
         raise HTTPException(status_code=404, detail="No accounting/log files matched")
 
-    files.sort(key=lambda x: (x["mtime"], x["name"]))
-    return files[-max(1, RECENT_PULL_MAX_FILES):]
+    # Rotated logs can number in the thousands while only the newest few are pulled.
+    newest = heapq.nlargest(max(1, RECENT_PULL_MAX_FILES), files, key=lambda x: (x["mtime"], x["name"]))
+    newest.reverse()
+    return newest
 
 
 def _read_from_cursor(files: List[Dict[str, Any]], cursor_payload: Optional[Dict[str, Any]], limit: int) -> Dict[str, Any]:
@@ -826,6 +1067,7 @@ def _read_from_cursor(files: List[Dict[str, Any]], cursor_payload: Optional[Dict
     idx = start_idx
     current_off = start_off
     consumed_up_to_idx = idx
+    partial_tail = False
 
     while 0 <= idx < len(files) and len(items) < limit:
         f = files[idx]
@@ -835,31 +1077,42 @@ def _read_from_cursor(files: List[Dict[str, Any]], cursor_payload: Optional[Dict
             current_off = 0
             continue
 
-        with fp.open("r", encoding="utf-8", errors="replace") as fh:
+        is_last_file = idx == len(files) - 1
+        source_name = str(f.get("name") or fp.name)
+        if not current_off:
+            _forget_line_format(f["name"])
+        with fp.open("rb", buffering=READ_BUFFER_BYTES) as fh:
             # Cursor pulls can resume mid-file (after the CSV header row was already consumed
             # in a previous request). Prime header state from line 1 so subsequent rows keep
             # structured keys (header_x-job-id, header_message-id, ...).
-            source_name = str(f.get("name") or fp.name)
             if current_off and source_name.lower().endswith(".csv"):
                 with _CSV_HEADER_STATE_LOCK:
                     have_header = bool(_CSV_HEADER_STATE.get(source_name))
                 if not have_header:
-                    first_line = fh.readline()
-                    if first_line:
-                        _parse_accounting_line(first_line.strip(), source_file=source_name, line_no_or_offset=1)
-                    fh.seek(current_off)
-            if current_off:
-                fh.seek(current_off)
+                    _parse_accounting_line(
+                        fh.readline().decode("utf-8", errors="replace").strip(),
+                        source_file=source_name,
+                        line_no_or_offset=1,
+                    )
+            fh.seek(current_off)
             while len(items) < limit:
-                line = fh.readline()
-                if not line:
+                raw = fh.readline()
+                if not raw:
+                    break
+                if is_last_file and not raw.endswith(b"\n"):
+                    # PMTA is still writing this row; leave it for the next pull.
+                    partial_tail = True
                     break
-                current_off = fh.tell()
-                s = str(line or "").strip()
-                if not s:
+                current_off += len(raw)
+                raw = raw.strip()
+                if not raw:
                     skipped += 1
                     continue
-                ev = _parse_accounting_line(s, source_file=f["name"], line_no_or_offset=current_off)
+                ev = _parse_accounting_line(
+                    raw.decode("utf-8", errors="replace"),
+                    source_file=f["name"],
+                    line_no_or_offset=current_off,
+                )
                 if not ev:
                     skipped += 1
                     continue
@@ -870,13 +1123,11 @@ def _read_from_cursor(files: List[Dict[str, Any]], cursor_payload: Optional[Dict
                 parsed += 1
 
         consumed_up_to_idx = idx
-        if len(items) >= limit:
+        if len(items) >= limit or is_last_file:
+            # The last file keeps the offset reached (it may have grown or end in a partial row).
             break
         idx += 1
-        if idx >= len(files):
-            current_off = int(f["size"])
-        else:
-            current_off = 0
+        current_off = 0
 
     if not files:
         raise HTTPException(status_code=404, detail="No accounting/log files matched")
@@ -897,7 +1148,9 @@ def _read_from_cursor(files: List[Dict[str, Any]], cursor_payload: Optional[Dict
     )
 
     has_more = False
-    if consumed_up_to_idx < len(files):
+    if partial_tail:
+        has_more = False
+    elif consumed_up_to_idx < len(files):
         if int(files[consumed_up_to_idx]["size"]) > int(current_off):
             has_more = True
         elif consumed_up_to_idx + 1 < len(files):
@@ -937,16 +1190,14 @@ def root():
             "pull_latest": "/api/v1/pull/latest?kind=acct",
             "job_outcomes": "/api/v1/job/outcomes?job_id=<job_id>",
             "job_count": "/api/v1/job/count?job_id=<job_id>",
+            "jobs_count": "/api/v1/jobs/count?job_ids=<job_id>,<job_id>",
         },
     }
 
 
 @app.get("/api/v1/status")
 def bridge_status(_: None = Depends(require_token)):
-    with _BRIDGE_STATUS_LOCK:
-        state = dict(_BRIDGE_STATUS)
-    state["server_time"] = datetime.now(timezone.utc).isoformat()
-    return {"ok": True, **state}
+    return {"ok": True, **_BRIDGE_STATUS, "server_time": datetime.now(timezone.utc).isoformat()}
 
 
 
@@ -987,79 +1238,321 @@ def get_job_outcomes(
     }
 
 
-def _calculate_job_outcomes(jid: str) -> Dict[str, Any]:
-    """Return unique recipient outcomes for one job id."""
+_LOG = logging.getLogger(__name__)
+_UNKNOWN_OUTCOME_SEEN = count(1)
 
-    patterns = ALLOWED_KINDS.get("acct") or ["acct-*.csv"]
-    by_recipient: Dict[str, Dict[str, Any]] = {}
-    status_rank = {"deferred": 1, "delivered": 2, "bounced": 2, "complained": 2}
+_JOB_STATUS_RANK = {"deferred": 1, "delivered": 2, "bounced": 2, "complained": 2}
 
-    for ev in _walk_accounting_events(patterns):
-        ev_jid = _event_job_id(ev)
-        if ev_jid != jid:
-            continue
 
-        rcpt = str(
-            ev.get("rcpt")
-            or ev.get("recipient")
-            or ev.get("email")
-            or ev.get("to")
-            or ev.get("rcpt_to")
-            or ""
-        ).strip().lower()
-        if not rcpt:
-            continue
+def _file_head(path: str) -> bytes:
+    """First ``_JOB_SCAN_HEAD_BYTES`` of a file, or ``b""`` if it cannot be read."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(_JOB_SCAN_HEAD_BYTES)
+    except OSError:
+        return b""
+
 
-        typ = _normalized_outcome(ev)
-        if typ not in {"delivered", "bounced", "deferred", "complained"}:
-            print(
-                f"[pmta-accounting-bridge] unknown outcome job_id={ev_jid} rcpt={rcpt} "
-                f"type={ev.get('type')} dsnAction={ev.get('dsnAction') or ev.get('dsn_action')} "
-                f"dsnStatus={ev.get('dsnStatus') or ev.get('dsn_status')} "
-                f"source_file={ev.get('source_file')} line={ev.get('line_no_or_offset')}"
+@lru_cache(maxsize=64)
+def _job_row_screen(jids: Tuple[str, ...]) -> Callable[[bytes], bool]:
+    """Case-insensitive predicate telling whether a raw row may belong to one of ``jids``.
+
+    Rows that look like a CSV header (``type,...`` or naming ``rcpt``) also pass, so a
+    header repeated mid-file still updates the column names.
+    """
+    if not jids or any(ord(c) > 127 for jid in jids for c in jid):
+        return lambda raw: True
+    if len(jids) == 1:
+        needle = jids[0].encode("ascii")
+
+        def one(raw: bytes) -> bool:
+            low = raw.lower()
+            return needle in low or b"rcpt" in low or low.startswith(b"type,")
+
+        return one
+    search = re.compile(b"|".join([re.escape(jid.encode("ascii")) for jid in jids] + [b"rcpt", b"^type,"])).search
+
+    def several(raw: bytes) -> bool:
+        return search(raw.lower()) is not None
+
+    return several
+
+
+def _fold_job_row(
+    recipients: _Winners,
+    ev: Dict[str, Any],
+    details: bool,
+) -> None:
+    """Apply one accounting row to the per-job winners if it belongs to a tracked job."""
+    idx = _EventIndex(ev)
+    ev_jid = _event_job_id(idx)
+    by_recipient = recipients.get(ev_jid)
+    if by_recipient is None:
+        return
+
+    rcpt = ev.get("rcpt") or ev.get("recipient") or ev.get("email") or ev.get("to") or ev.get("rcpt_to")
+    if not rcpt:
+        return
+    rcpt = (rcpt if type(rcpt) is str else str(rcpt)).strip().lower()
+    if not rcpt:
+        return
+
+    status_rank = _JOB_STATUS_RANK
+    typ = _normalized_outcome(idx)
+    rank = status_rank.get(typ)
+    if rank is None:
+        # A malformed file can hold many such rows; report the first and then every Nth.
+        seen = next(_UNKNOWN_OUTCOME_SEEN)
+        if seen == 1 or seen % UNKNOWN_OUTCOME_LOG_EVERY == 0:
+            _LOG.warning(
+                "unknown outcome (#%d) job_id=%s rcpt=%s type=%s dsnAction=%s dsnStatus=%s source_file=%s offset=%s",
+                seen,
+                ev_jid,
+                rcpt,
+                ev.get("type"),
+                ev.get("dsnAction") or ev.get("dsn_action"),
+                ev.get("dsnStatus") or ev.get("dsn_status"),
+                ev.get("source_file"),
+                ev.get("line_no_or_offset"),
             )
-            continue
+        return
+
+    # Stored rows only ever hold ranked outcomes, so prev[0] is always a rank key.
+    prev = by_recipient.get(rcpt)
+    if prev and rank < status_rank[prev[0]]:
+        return
+    if not details:
+        by_recipient[rcpt] = (typ, "", "", "", "")
+        return
+    by_recipient[rcpt] = (
+        typ,
+        idx.value("msgid", "message-id", "message_id", "messageid"),
+        idx.value("dsnStatus", "dsn_status", "enhanced-status", "enhanced_status"),
+        idx.value("dsnDiag", "dsn_diag", "diag", "diagnostic", "smtp-diagnostic"),
+        idx.value("response", "smtp-response", "smtp_response"),
+    )
+
+
+def _collect_file_job_recipients(
+    path: str,
+    jids: Tuple[str, ...],
+    details: bool,
+    start: int = 0,
+) -> Optional[Tuple[int, _Winners, _Winners]]:
+    """Return (end offset, winners of complete rows from ``start``, winners of a partial last row).
+
+    Returns None if the file has been removed since it was listed.
+    """
+    recipients: _Winners = {jid: {} for jid in jids}
+    source_name = os.path.basename(path)
+    pos = start
+    tail = b""
+    # Rows without any job id in their raw bytes are skipped; line 1 always goes through for the header.
+    mentions_job = _job_row_screen(jids)
+    try:
+        f = open(path, "rb", buffering=READ_BUFFER_BYTES)
+    except FileNotFoundError:
+        return None
+    if not start:
+        _forget_line_format(source_name)
+
+    with f:
+        _advise_sequential(f)
+        if start and source_name.lower().endswith(".csv"):
+            # Resuming mid-file: prime the header so rows keep their structured keys.
+            with _CSV_HEADER_STATE_LOCK:
+                have_header = bool(_CSV_HEADER_STATE.get(source_name))
+            if not have_header:
+                # Rows here are labelled by byte offset, and the header starts at 0.
+                _parse_accounting_line(
+                    f.readline().decode("utf-8", errors="replace").strip(),
+                    source_file=source_name,
+                    line_no_or_offset=0,
+                )
+            f.seek(start)
+        elif start:
+            f.seek(start)
+
+        for raw in f:
+            if not raw.endswith(b"\n"):
+                tail = raw
+                break
+            line_off = pos
+            pos += len(raw)
+            if line_off and not mentions_job(raw):
+                continue
+            line = raw.decode("utf-8", errors="replace").strip()
+            if not line:
+                continue
+            ev = _parse_accounting_line(line, source_file=source_name, line_no_or_offset=line_off)
+            if ev:
+                _fold_job_row(recipients, ev, details)
+
+    pending: _Winners = {jid: {} for jid in jids}
+    if tail.strip():
+        ev = _parse_accounting_line(
+            tail.decode("utf-8", errors="replace").strip(), source_file=source_name, line_no_or_offset=pos
+        )
+        if ev:
+            _fold_job_row(pending, ev, details)
+    return pos, recipients, pending
+
+
+def _merge_job_winners(
+    into: _Winners,
+    later: _Winners,
+) -> None:
+    """Fold winners of later rows into ``into`` with the same rank rule as ``_fold_job_row``."""
+    status_rank = _JOB_STATUS_RANK
+    for jid, rows in later.items():
+        by_recipient = into[jid]
+        for rcpt, row in rows.items():
+            prev = by_recipient.get(rcpt)
+            if prev and status_rank[row[0]] < status_rank[prev[0]]:
+                continue
+            by_recipient[rcpt] = row
+
+
+def _scan_pool() -> ProcessPoolExecutor:
+    """Shared worker pool for job scans; spawned, since forking a threaded server can copy held locks."""
+    global _SCAN_POOL
+    with _SCAN_POOL_LOCK:
+        if _SCAN_POOL is None:
+            _SCAN_POOL = ProcessPoolExecutor(
+                max_workers=ACCOUNTING_SCAN_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _SCAN_POOL
+
+
+@atexit.register
+def _shutdown_scan_pool() -> None:
+    """Stop the scan workers; also drops a broken pool so the next scan spawns a new one."""
+    global _SCAN_POOL
+    with _SCAN_POOL_LOCK:
+        pool, _SCAN_POOL = _SCAN_POOL, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
 
-        item = {
-            "email": rcpt,
-            "outcome": typ,
-            "message_id": _event_value(ev, "msgid", "message-id", "message_id", "messageid"),
-            "dsn_status": _event_value(ev, "dsnStatus", "dsn_status", "enhanced-status", "enhanced_status"),
-            "dsn_diag": _event_value(ev, "dsnDiag", "dsn_diag", "diag", "diagnostic", "smtp-diagnostic"),
-            "response": _event_value(ev, "response", "smtp-response", "smtp_response"),
-        }
 
-        prev = by_recipient.get(rcpt)
-        if not prev:
-            by_recipient[rcpt] = item
+def _collect_job_recipients(
+    jids: List[str],
+    details: bool = True,
+) -> _Winners:
+    """Winning (outcome, message_id, dsn_status, dsn_diag, response) row per recipient for each job id.
+
+    The result is cached per files fingerprint and shared, so it must not be mutated.
+    """
+
+    patterns = ALLOWED_KINDS.get("acct") or ["acct-*.csv"]
+    found = sorted(_listed_matching_files(patterns), key=lambda x: x[2].st_mtime, reverse=True)
+    if not found:
+        raise HTTPException(status_code=404, detail="No accounting/log files matched")
+    fingerprint = tuple((path, st.st_ino, st.st_size, st.st_mtime_ns) for _, path, st in found)
+    key = (tuple(jids), details)
+    with _JOB_RESULT_LOCK:
+        cached = _JOB_RESULT_CACHE.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            _JOB_RESULT_CACHE.move_to_end(key)
+            return cached[1]
+
+    recipients = _scan_job_recipients(key[0], details, fingerprint)
+    with _JOB_RESULT_LOCK:
+        _JOB_RESULT_CACHE[key] = (fingerprint, recipients)
+        _JOB_RESULT_CACHE.move_to_end(key)
+        while len(_JOB_RESULT_CACHE) > _JOB_RESULT_CACHE_MAX:
+            _JOB_RESULT_CACHE.popitem(last=False)
+    return recipients
+
+
+def _scan_job_recipients(
+    jids: Tuple[str, ...],
+    details: bool,
+    fingerprint: _Fingerprint,
+) -> _Winners:
+    paths = [fp[0] for fp in fingerprint]
+    starts: List[int] = []
+    bases: List[List[Optional[Tuple[int, _Bucket]]]] = []
+    kept: List[Tuple[bytes, Dict[Tuple[str, bool], Tuple[int, _Bucket]]]] = []
+    with _JOB_SCAN_STATE_LOCK:
+        prevs = [_JOB_SCAN_STATE.get(path) for path in paths]
+    for (path, inode, size, mtime_ns), prev in zip(fingerprint, prevs):
+        if prev is None or prev[0] != inode or size < prev[1]:
+            head, jobs = _file_head(path), {}
+        elif (size, mtime_ns) == (prev[1], prev[2]):
+            head, jobs = prev[3], prev[4]
+        else:
+            # Grown in place: a copytruncate can refill the file past the old offset.
+            head = _file_head(path)
+            jobs = prev[4] if head.startswith(prev[3]) else {}
+        base = [jobs.get((jid, details)) for jid in jids]
+        # Rows between two job ids' offsets are folded again; the rank rule makes that a no-op.
+        starts.append(min(b[0] if b is not None else 0 for b in base))
+        bases.append(base)
+        kept.append((head, jobs))
+
+    scanned = None
+    if min(ACCOUNTING_SCAN_WORKERS, len(paths)) > 1:
+        try:
+            scanned = list(_scan_pool().map(_collect_file_job_recipients, paths, repeat(jids), repeat(details), starts))
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM-killed); answer in-process and respawn on the next scan.
+            _shutdown_scan_pool()
+    if scanned is None:
+        scanned = [_collect_file_job_recipients(path, jids, details, start) for path, start in zip(paths, starts)]
+
+    recipients: _Winners = {jid: {} for jid in jids}
+    states: List[Tuple[str, _ScanState]] = []
+    for (path, inode, size, mtime_ns), base, (head, jobs), result in zip(fingerprint, bases, kept, scanned):
+        if result is None:
+            _drop_dir_listing()
             continue
-        prev_typ = str(prev.get("outcome") or "")
-        if status_rank.get(typ, 0) >= status_rank.get(prev_typ, 0):
-            by_recipient[rcpt] = item
+        end, added, pending = result
+        complete = {jid: dict(b[1]) if b is not None else {} for jid, b in zip(jids, base)}
+        _merge_job_winners(complete, added)
+        _merge_job_winners(recipients, complete)
+        _merge_job_winners(recipients, pending)
+        updated = {(jid, details): (end, complete[jid]) for jid in jids}
+        merged = {k: v for k, v in jobs.items() if k not in updated}
+        merged.update(updated)
+        for k in list(merged)[: max(0, len(merged) - _JOB_SCAN_JOBS_MAX)]:
+            del merged[k]
+        states.append((path, (inode, size, mtime_ns, head[:end], merged)))
+
+    with _JOB_SCAN_STATE_LOCK:
+        for path, state in states:
+            _JOB_SCAN_STATE[path] = state
+            _JOB_SCAN_STATE.move_to_end(path)
+        while len(_JOB_SCAN_STATE) > _JOB_SCAN_STATE_MAX:
+            _JOB_SCAN_STATE.popitem(last=False)
+
+    return recipients
 
+
+def _calculate_job_outcomes(jid: str) -> Dict[str, Any]:
+    """Return unique recipient outcomes for one job id."""
+    return _summarize_job_outcomes(_collect_job_recipients([jid])[jid])
+
+
+def _summarize_job_outcomes(by_recipient: _Bucket) -> Dict[str, Any]:
     buckets: Dict[str, List[str]] = {
         "delivered": [],
         "deferred": [],
         "bounced": [],
         "complained": [],
     }
-    for email, row in by_recipient.items():
-        typ = str(row.get("outcome") or "")
-        buckets[typ].append(email)
-
-    for k in buckets:
-        buckets[k] = sorted(set(buckets[k]))
-
     all_rows = []
-    for email in sorted(by_recipient.keys()):
-        row = by_recipient[email]
+    # Recipients are unique keys, so one sorted pass fills both sorted views.
+    for email in sorted(by_recipient):
+        typ, message_id, dsn_status, dsn_diag, response = by_recipient[email]
+        buckets[typ].append(email)
         all_rows.append({
             "email": email,
-            "outcome": row.get("outcome") or "",
-            "message_id": row.get("message_id") or "",
-            "dsn_status": row.get("dsn_status") or "",
-            "dsn_diag": row.get("dsn_diag") or "",
-            "response": row.get("response") or "",
+            "outcome": typ,
+            "message_id": message_id or "",
+            "dsn_status": dsn_status or "",
+            "dsn_diag": dsn_diag or "",
+            "response": response or "",
         })
 
     total_unique = sum(len(v) for v in buckets.values())
@@ -1080,16 +1573,48 @@ def get_job_count(
     if not jid:
         raise HTTPException(status_code=400, detail="Missing required query param: job_id")
 
-    summary = _calculate_job_outcomes(jid)
-    buckets = summary["buckets"]
+    counts = _count_job_outcomes(_collect_job_recipients([jid], details=False)[jid])
+    return {"ok": True, **_job_count_payload(jid, counts)}
+
+
+@app.get("/api/v1/jobs/count")
+def get_jobs_count(
+    job_ids: str = "",
+    _: None = Depends(require_token),
+):
+    """Return bridge-side unique recipient counts for several comma-separated job ids."""
+    jids: List[str] = []
+    for raw in (job_ids or "").split(","):
+        jid = _normalize_job_id(raw)
+        if jid and jid not in jids:
+            jids.append(jid)
+    if not jids:
+        raise HTTPException(status_code=400, detail="Missing required query param: job_ids")
+
+    recipients = _collect_job_recipients(jids, details=False)
     return {
         "ok": True,
+        "count": len(jids),
+        "jobs": {jid: _job_count_payload(jid, _count_job_outcomes(recipients[jid])) for jid in jids},
+    }
+
+
+def _count_job_outcomes(by_recipient: _Bucket) -> Dict[str, int]:
+    """Per-outcome unique recipient counts, without building the sorted email lists."""
+    counts = {"delivered": 0, "deferred": 0, "bounced": 0, "complained": 0}
+    for row in by_recipient.values():
+        counts[row[0]] += 1
+    return counts
+
+
+def _job_count_payload(jid: str, counts: Dict[str, int]) -> Dict[str, Any]:
+    return {
         "job_id": jid,
-        "linked_emails_count": summary["total_unique"],
-        "delivered_count": len(buckets["delivered"]),
-        "deferred_count": len(buckets["deferred"]),
-        "bounced_count": len(buckets["bounced"]),
-        "complained_count": len(buckets["complained"]),
+        "linked_emails_count": sum(counts.values()),
+        "delivered_count": counts["delivered"],
+        "deferred_count": counts["deferred"],
+        "bounced_count": counts["bounced"],
+        "complained_count": counts["complained"],
     }
 
 @app.get("/api/v1/files")
@@ -1110,10 +1635,17 @@ def get_files(
     key_map = {"mtime": "mtime_epoch", "name": "name", "size": "size_bytes"}
     sort_key = key_map.get(sort, "mtime_epoch")
     reverse = (order.lower() != "asc")
-    items.sort(key=lambda x: x[sort_key], reverse=reverse)
+    start = max(offset, 0)
+    stop = start + max(limit, 1)
 
     total = len(items)
-    items = items[max(offset, 0): max(offset, 0) + max(limit, 1)]
+    if stop < total:
+        # Only the first `stop` rows in sort order are needed; same order as a full sort.
+        pick = heapq.nlargest if reverse else heapq.nsmallest
+        items = pick(stop, items, key=lambda x: x[sort_key])[start:]
+    else:
+        items.sort(key=lambda x: x[sort_key], reverse=reverse)
+        items = items[start:stop]
 
     return {
         "ok": True,
@@ -1146,37 +1678,59 @@ def _pull_accounting(
 
     if not jid:
         latest_fp = _find_latest_file(patterns)
-        events: List[Dict[str, Any]] = []
-        with latest_fp.open("r", encoding="utf-8", errors="replace") as f:
+        try:
+            f = latest_fp.open("r", encoding="utf-8", errors="replace", buffering=READ_BUFFER_BYTES)
+        except FileNotFoundError:
+            # Rotated away since the cached listing; list again.
+            _drop_dir_listing()
+            latest_fp = _find_latest_file(patterns)
+            f = latest_fp.open("r", encoding="utf-8", errors="replace", buffering=READ_BUFFER_BYTES)
+        # Only the last safe_max rows are kept and structured.
+        tail: Deque[Dict[str, Any]] = deque(maxlen=safe_max)
+        _forget_line_format(latest_fp.name)
+        with f:
+            _advise_sequential(f)
             for line_no, raw_line in enumerate(f, start=1):
                 line = str(raw_line or "").strip()
                 if line:
                     ev = _parse_accounting_line(line, source_file=latest_fp.name, line_no_or_offset=line_no)
                     if ev:
-                        events.append(_structured_event(ev))
+                        tail.append(ev)
 
         return {
             "ok": True,
             "job_id": "",
-            "count": min(len(events), safe_max),
-            "events": events[-safe_max:],
+            "count": len(tail),
+            "events": [_structured_event(ev) for ev in tail],
             "source_file": latest_fp.name,
         }
 
     files = _find_matching_files(patterns)
     events: List[Dict[str, Any]] = []
+    # Same raw-byte job id screen as _collect_file_job_recipients.
+    mentions_job = _job_row_screen((jid,))
 
     for fp in files:
-        with fp.open("r", encoding="utf-8", errors="replace") as f:
+        try:
+            f = fp.open("rb", buffering=READ_BUFFER_BYTES)
+        except FileNotFoundError:
+            _drop_dir_listing()
+            continue
+        _forget_line_format(fp.name)
+        with f:
+            _advise_sequential(f)
             for line_no, raw_line in enumerate(f, start=1):
-                line = str(raw_line or "").strip()
+                if line_no > 1 and not mentions_job(raw_line):
+                    continue
+                line = raw_line.decode("utf-8", errors="replace").strip()
                 if not line:
                     continue
                 ev = _parse_accounting_line(line, source_file=fp.name, line_no_or_offset=line_no)
                 if not ev:
                     continue
-                if _event_job_id(ev) == jid:
-                    events.append(_structured_event(ev))
+                idx = _EventIndex(ev)
+                if _event_job_id(idx) == jid:
+                    events.append(_structured_event(idx))
                 if len(events) >= safe_max:
                     break
         if len(events) >= safe_max:
@@ -11,6 +11,7 @@ try:
 except Exception:  # pragma: no cover - runtime compatibility for Python builds without _ssl
     ssl = None  # type: ignore
 import http.client
+import gzip
 import subprocess
 import time
 import traceback
@@ -91,6 +92,12 @@ try:
 except Exception:
     spamc = None  # type: ignore
 
+# Optional fast JSON decoder for large bridge payloads (stdlib json otherwise)
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # type: ignore
+
 # Optional DNS MX resolver (dnspython) for better domain->mail IP resolution
 # pip install dnspython
 try:
@@ -4348,6 +4355,8 @@ def start_db_writer_if_needed() -> None:
 
 
 def db_init() -> None:
+    global _BRIDGE_CURSOR_SAVED
+    _BRIDGE_CURSOR_SAVED = ("", "")
     with DB_LOCK:
         conn = _db_conn()
         try:
@@ -14418,6 +14427,8 @@ except Exception:
     PMTA_BRIDGE_PULL_PORT = 8090
 PMTA_BRIDGE_PULL_PATH = "/api/v1/pull"
 PMTA_BRIDGE_JOB_COUNT_PATH = "/api/v1/job/count"
+PMTA_BRIDGE_JOBS_COUNT_PATH = "/api/v1/jobs/count"
+PMTA_BRIDGE_JOBS_COUNT_BATCH = 50
 PMTA_BRIDGE_JOB_OUTCOMES_PATH = "/api/v1/job/outcomes"
 BRIDGE_BASE_URL = (os.getenv("BRIDGE_BASE_URL", "") or "").strip()
 try:
@@ -14482,6 +14493,8 @@ _BRIDGE_DEBUG_STATE: Dict[str, Any] = {
 
 _BRIDGE_POLLER_LOCK = threading.Lock()
 _BRIDGE_POLLER_STARTED = False
+# base_url -> time.time() until which the batched /jobs/count endpoint is not retried
+_BRIDGE_JOBS_COUNT_UNSUPPORTED: Dict[str, float] = {}
 _BRIDGE_CURSOR_COMPAT_WARNED = False
 _BRIDGE_POLL_CYCLE_LOCK = threading.Lock()
 
@@ -14550,6 +14563,56 @@ def _resolve_bridge_base_url_runtime() -> str:
     return f"http://{host}:{PMTA_BRIDGE_PULL_PORT}"
 
 
+# Keep-alive connection to the bridge, one per thread (the poller and UI handlers
+# may call the bridge concurrently and http.client connections are not thread-safe).
+_BRIDGE_HTTP_LOCAL = threading.local()
+
+
+def _bridge_http_connection(host: str, port: int, timeout_s: float) -> http.client.HTTPConnection:
+    key = (host, int(port), float(timeout_s))
+    cached = getattr(_BRIDGE_HTTP_LOCAL, "conn", None)
+    if cached is not None:
+        if cached[0] == key:
+            return cached[1]
+        _bridge_http_close()
+    conn = http.client.HTTPConnection(host, port=port, timeout=timeout_s)
+    _BRIDGE_HTTP_LOCAL.conn = (key, conn)
+    return conn
+
+
+def _bridge_http_close() -> None:
+    cached = getattr(_BRIDGE_HTTP_LOCAL, "conn", None)
+    _BRIDGE_HTTP_LOCAL.conn = None
+    if cached is not None:
+        try:
+            cached[1].close()
+        except Exception:
+            pass
+
+
+_BRIDGE_REQUEST_HEADERS = {"Accept": "application/json", "Accept-Encoding": "gzip"}
+# base URL -> (host, port, path prefix); the poller re-sends the same base every cycle.
+_BRIDGE_BASE_PARTS: Dict[str, Tuple[str, int, str]] = {}
+
+
+def _bridge_base_parts(base: str) -> Tuple[str, int, str]:
+    cached = _BRIDGE_BASE_PARTS.get(base)
+    if cached is not None:
+        return cached
+
+    parsed = urlsplit(base.rstrip("/"))
+    if parsed.scheme.lower() != "http":
+        raise ValueError("bridge client supports HTTP only")
+
+    host = (parsed.hostname or "").strip()
+    if not host:
+        raise ValueError("bridge host is missing")
+
+    parts = (host, parsed.port or 80, parsed.path or "")
+    _BRIDGE_BASE_PARTS[base] = parts
+    return parts
+
+
 def bridge_get_json(path: str, params: dict) -> dict:
     base = (BRIDGE_BASE_URL or "").strip()
     if not base:
@@ -14560,39 +14623,48 @@ def bridge_get_json(path: str, params: dict) -> dict:
     p = (path or "").strip() or "/"
     if not p.startswith("/"):
         p = "/" + p
+    host, port, base_path = _bridge_base_parts(base)
+    target = f"{base_path}{p}"
     query = urlencode(params or {}, doseq=True)
-    full_url = f"{base.rstrip('/')}{p}"
     if query:
-        full_url = f"{full_url}?{query}"
-
-    parsed = urlsplit(full_url)
-    if parsed.scheme.lower() != "http":
-        raise ValueError("bridge client supports HTTP only")
+        target = f"{target}?{query}"
 
-    host = (parsed.hostname or "").strip()
-    if not host:
-        raise ValueError("bridge host is missing")
-
-    port = parsed.port or 80
-    target = parsed.path or "/"
-    if parsed.query:
-        target = f"{target}?{parsed.query}"
-
-    conn = http.client.HTTPConnection(host, port=port, timeout=float(BRIDGE_TIMEOUT_S or 20.0))
-    try:
-        conn.request("GET", target, headers={"Accept": "application/json"})
-        resp = conn.getresponse()
-        status = int(getattr(resp, "status", 0) or 0)
-        raw = (resp.read() or b"").decode("utf-8", errors="replace")
-    finally:
-        conn.close()
+    timeout_s = float(BRIDGE_TIMEOUT_S or 20.0)
+    for attempt in range(2):
+        conn = _bridge_http_connection(host, port, timeout_s)
+        try:
+            conn.request("GET", target, headers=_BRIDGE_REQUEST_HEADERS)
+            resp = conn.getresponse()
+            status = int(getattr(resp, "status", 0) or 0)
+            body = resp.read() or b""
+            if body and (resp.getheader("Content-Encoding") or "").strip().lower() == "gzip":
+                body = gzip.decompress(body)
+        except (http.client.BadStatusLine, ConnectionResetError, BrokenPipeError):
+            # The bridge closed an idle keep-alive socket; reconnect once.
+            _bridge_http_close()
+            if attempt:
+                raise
+            continue
+        except Exception:
+            _bridge_http_close()
+            raise
+        if resp.will_close:
+            _bridge_http_close()
+        break
 
     if status != 200:
-        snippet = raw[:220].replace("\n", " ").replace("\r", " ")
+        snippet = body[:220].decode("utf-8", errors="replace").replace("\n", " ").replace("\r", " ")
         raise RuntimeError(f"bridge_http_status={status} body={snippet!r}")
 
     try:
-        obj = json.loads(raw or "{}")
+        if orjson is not None:
+            try:
+                obj = orjson.loads(body or b"{}")
+            except orjson.JSONDecodeError:
+                # orjson rejects invalid UTF-8 (e.g. a Latin-1 byte in a bounce reason).
+                obj = json.loads(body.decode("utf-8", errors="replace") or "{}")
+        else:
+            obj = json.loads(body.decode("utf-8", errors="replace") or "{}")
     except Exception as e:
         raise ValueError(f"invalid_json_response: {e}")
     if not isinstance(obj, dict):
@@ -14618,20 +14690,30 @@ def _bridge_push_sample(key: str, entry: dict, max_keep: int = 24) -> None:
 _OUTCOME_CACHE_LOCK = threading.Lock()
 _OUTCOME_CACHE: Dict[Tuple[str, str], str] = {}
 
-# Extract job id from Message-ID we generate:
+# Extract job id from Message-ID we generate (the campaign segment is optional):
 #   <uuid.<job_id>.<campaign_id>.c<chunk>.w<worker>@local>
-_JOBID_RE_1 = re.compile(r"[.][a-f0-9]{8,64}[.]([a-f0-9]{12})[.]([a-f0-9]{8,64}|none)[.]c[0-9]+[.]w[0-9]+@local", re.IGNORECASE)
-_JOBID_RE_2 = re.compile(r"[.][a-f0-9]{8,64}[.]([a-f0-9]{12})[.]c[0-9]+[.]w[0-9]+@local", re.IGNORECASE)
+_JOBID_RE = re.compile(
+    r"[.][a-f0-9]{8,64}[.]([a-f0-9]{12})(?:[.](?:[a-f0-9]{8,64}|none))?[.]c[0-9]+[.]w[0-9]+@local",
+    re.IGNORECASE,
+)
+_WS_RE = re.compile(r"\s+")
+_SMTP_CODE_RE = re.compile(r"\b([245])[0-9]{2}\b")
+_SMTP_ENHANCED_RE = re.compile(r"\b([245])\.[0-9]\.[0-9]\b")
+# Substring probes for free-form status text, one alternation per outcome (checked in order).
+_OUT_DELIV_RE = re.compile("|".join(map(re.escape, ("success", "2.0.0", "relayed", "delivered", "accepted", "250 "))))
+_OUT_BOUNCE_RE = re.compile(
+    "|".join(map(re.escape, ("bounce", "bounced", "failed", "failure", "reject", "5.", " 550", " 551", " 552", " 553", " 554")))
+)
+_OUT_DEFER_RE = re.compile("|".join(map(re.escape, ("defer", "deferred", "transient", "4.", " 421", " 450", " 451", " 452"))))
+_OUT_COMPL_RE = re.compile("|".join(map(re.escape, ("complaint", "fbl", "abuse"))))
 
 
 def _extract_job_id_from_text(text: str) -> str:
     t = (text or "").strip()
-    if not t:
+    # Every match ends in "@local"; text without an "@" skips the regex.
+    if "@" not in t:
         return ""
-    m = _JOBID_RE_1.search(t)
-    if m:
-        return m.group(1).lower()
-    m = _JOBID_RE_2.search(t)
+    m = _JOBID_RE.search(t)
     if m:
         return m.group(1).lower()
     return ""
@@ -14641,7 +14723,7 @@ def _normalize_outcome_type(v: Any) -> str:
     s = ("" if v is None else str(v)).strip().lower()
     if not s:
         return ""
-    s = re.sub(r"\s+", " ", s)
+    s = _WS_RE.sub(" ", s)
     # PMTA accounting often uses a 1-letter type.
     if s in {"d", "delivered", "delivery", "success", "accepted", "ok", "sent"}:
         return "delivered"
@@ -14654,13 +14736,13 @@ def _normalize_outcome_type(v: Any) -> str:
 
     # PMTA accounting CSV often stores status words in longer values,
     # e.g. dsnStatus="2.0.0 (success)" or dsnAction="relayed".
-    if any(x in s for x in ("success", "2.0.0", "relayed", "delivered", "accepted", "250 ")):
+    if _OUT_DELIV_RE.search(s):
         return "delivered"
-    if any(x in s for x in ("bounce", "bounced", "failed", "failure", "reject", "5.", " 550", " 551", " 552", " 553", " 554")):
+    if _OUT_BOUNCE_RE.search(s):
         return "bounced"
-    if any(x in s for x in ("defer", "deferred", "transient", "4.", " 421", " 450", " 451", " 452")):
+    if _OUT_DEFER_RE.search(s):
         return "deferred"
-    if any(x in s for x in ("complaint", "fbl", "abuse")):
+    if _OUT_COMPL_RE.search(s):
         return "complained"
     return s
 
@@ -14905,9 +14987,9 @@ def _classify_accounting_response(ev: dict, typ: str) -> Tuple[str, str]:
     full = " | ".join(parts)
 
     probe = " ".join(parts).lower()
-    code_match = re.search(r"\b([245])[0-9]{2}\b", probe)
+    code_match = _SMTP_CODE_RE.search(probe)
     if not code_match:
-        code_match = re.search(r"\b([245])\.[0-9]\.[0-9]\b", probe)
+        code_match = _SMTP_ENHANCED_RE.search(probe)
 
     if code_match:
         lead = code_match.group(1)
@@ -15208,12 +15290,20 @@ def _db_get_bridge_cursor() -> str:
             conn.close()
 
 
+# (DB_PATH, cursor) last written to bridge_pull_state; db_init() resets it.
+_BRIDGE_CURSOR_SAVED: Tuple[str, str] = ("", "")
+
+
 def _db_set_bridge_cursor(cursor: str) -> None:
+    global _BRIDGE_CURSOR_SAVED
     if _bridge_mode_counts_enabled():
         return
     cur = (cursor or "").strip()
     if not cur:
         return
+    # Idle polls hand back the same cursor; skip the SQLite write (and its fsync) then.
+    if (DB_PATH, cur) == _BRIDGE_CURSOR_SAVED:
+        return
     with DB_LOCK:
         conn = _db_conn()
         try:
@@ -15229,6 +15319,7 @@ def _db_set_bridge_cursor(cursor: str) -> None:
                 ("accounting_cursor", cur, ts),
             )
             conn.commit()
+            _BRIDGE_CURSOR_SAVED = (DB_PATH, cur)
         finally:
             conn.close()
 
@@ -15294,6 +15385,54 @@ def _bridge_fetch_json(req_url: str, headers: Dict[str, str], max_request_attemp
     return None, request_error
 
 
+def _bridge_fetch_job_counts(base_url: str, headers: Dict[str, str], jids: List[str]) -> Dict[str, dict]:
+    """Fetch counts for many jobs through the batched endpoint (one bridge file scan per request).
+
+    Returns an empty/partial mapping when the bridge does not support it; callers fall back
+    to per-job /api/v1/job/count requests for any job id missing from the result.
+    """
+    wanted = [j for j in dict.fromkeys(jids) if j]
+    if len(wanted) < 2:
+        return {}
+    if _BRIDGE_JOBS_COUNT_UNSUPPORTED.get(base_url, 0.0) > time.time():
+        return {}
+
+    out: Dict[str, dict] = {}
+    for i in range(0, len(wanted), PMTA_BRIDGE_JOBS_COUNT_BATCH):
+        chunk = wanted[i:i + PMTA_BRIDGE_JOBS_COUNT_BATCH]
+        url = f"{base_url}{PMTA_BRIDGE_JOBS_COUNT_PATH}?job_ids={quote_plus(','.join(chunk))}"
+        obj, err = _bridge_fetch_json(url, headers, max_request_attempts=1)
+        jobs_obj = obj.get("jobs") if isinstance(obj, dict) else None
+        err_text = str(err or "")
+        route_missing = err_text.startswith("bridge_http_status=405 ") or (
+            err_text.startswith("bridge_http_status=404 ") and '"detail":"Not Found"' in err_text
+        )
+        if err_text.startswith("bridge_http_status=404 ") and not route_missing:
+            # The bridge's own 404: no accounting files matched, so nothing is counted yet.
+            for jid in chunk:
+                key = jid.strip().lower()
+                out[key] = {
+                    "job_id": key,
+                    "linked_emails_count": 0,
+                    "delivered_count": 0,
+                    "deferred_count": 0,
+                    "bounced_count": 0,
+                    "complained_count": 0,
+                }
+            continue
+        if err is not None and not route_missing:
+            # Timeouts, resets and 5xx fall back to per-job requests for this cycle only.
+            break
+        if not isinstance(jobs_obj, dict):
+            # Older bridges have no such route; stop trying for a while.
+            _BRIDGE_JOBS_COUNT_UNSUPPORTED[base_url] = time.time() + 300.0
+            break
+        for jid, count_obj in jobs_obj.items():
+            if isinstance(count_obj, dict):
+                out[str(jid or "").strip().lower()] = count_obj
+    return out
+
+
 def _bridge_outcome_emails(obj: dict, key: str) -> List[str]:
     bucket = obj.get(key)
     if not isinstance(bucket, dict):
@@ -15595,6 +15734,7 @@ def _poll_accounting_bridge_once() -> dict:
         job_results: List[Dict[str, Any]] = []
         jobs_success = 0
         jobs_failed = 0
+        batched_counts = _bridge_fetch_job_counts(base_url, headers, [_job_pmta_job_id(job) for job in jobs])
 
         for job in jobs:
             jid = _job_pmta_job_id(job)
@@ -15606,8 +15746,11 @@ def _poll_accounting_bridge_once() -> dict:
                 "pmta_job_id": jid,
                 "outcomes_sync_enabled": bool(BRIDGE_POLL_FETCH_OUTCOMES),
             }
-            count_url = f"{base_url}{PMTA_BRIDGE_JOB_COUNT_PATH}?job_id={quote_plus(jid)}"
-            count_obj, count_error = _bridge_fetch_json(count_url, headers)
+            count_obj: Optional[dict] = batched_counts.get(jid)
+            count_error: Optional[Exception] = None
+            if count_obj is None:
+                count_url = f"{base_url}{PMTA_BRIDGE_JOB_COUNT_PATH}?job_id={quote_plus(jid)}"
+                count_obj, count_error = _bridge_fetch_json(count_url, headers)
             if count_error is not None or not isinstance(count_obj, dict):
                 err_msg = f"bridge_count_failed job_id={jid} error={count_error}"
                 logger.exception(err_msg) if count_error is not None else logger.error(err_msg)
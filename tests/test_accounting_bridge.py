@@ -0,0 +1,441 @@
+import itertools
+import logging
+
+import pytest
+
+import pmta_accounting_bridge as bridge
+
+
+_SAMPLE = (bridge.Path(__file__).resolve().parent / "fixtures" / "acct-sample.csv").read_text(encoding="utf-8")
+
+
+@pytest.fixture(autouse=True)
+def _reset_line_state():
+    bridge._CSV_HEADER_STATE.clear()
+    bridge._LINE_FORMAT_STATE.clear()
+
+
+@pytest.fixture
+def log_dir(tmp_path, monkeypatch):
+    """Empty PMTA_LOG_DIR, listed afresh on every call, with no cached scans or header state."""
+    monkeypatch.setattr(bridge, "PMTA_LOG_DIR", tmp_path)
+    monkeypatch.setattr(bridge, "DIR_LISTING_TTL_SECONDS", 0)
+    for cache in (
+        bridge._DIR_LISTING_CACHE,
+        bridge._JOB_SCAN_STATE,
+        bridge._JOB_RESULT_CACHE,
+        bridge._CSV_HEADER_STATE,
+        bridge._LINE_FORMAT_STATE,
+    ):
+        cache.clear()
+    return tmp_path
+
+
+def test_parse_accounting_line_splits_plain_and_quoted_rows():
+    bridge._CSV_HEADER_STATE.clear()
+    assert bridge._parse_accounting_line("type,rcpt,dsnDiag", source_file="acct-x.csv") is None
+
+    plain = bridge._parse_accounting_line("d, a@example.com ,250 ok", source_file="acct-x.csv")
+    assert plain["rcpt"] == "a@example.com"
+    assert plain["dsndiag"] == "250 ok"
+
+    quoted = bridge._parse_accounting_line('b,b@example.com,"550 5.1.1 no, such user"', source_file="acct-x.csv")
+    assert quoted["rcpt"] == "b@example.com"
+    assert quoted["dsndiag"] == "550 5.1.1 no, such user"
+
+
+class _FakeRequest:
+    def __init__(self, headers=None):
+        self.headers = headers or {}
+
+
+def test_pull_latest_without_job_returns_last_rows(log_dir):
+    rows = ["type,rcpt,dsnStatus"] + ["d,u{}@example.com,2.0.0".format(i) for i in range(10)]
+    (log_dir / "acct-1.csv").write_text("\n".join(rows) + "\n", encoding="utf-8")
+
+    payload = bridge._pull_accounting(_FakeRequest(), kind="acct", max_lines=3)
+
+    assert payload["count"] == 3
+    assert [ev["rcpt"] for ev in payload["events"]] == ["u7@example.com", "u8@example.com", "u9@example.com"]
+    assert all(ev["outcome"] == "delivered" for ev in payload["events"])
+
+
+def test_pull_with_job_id_returns_only_that_jobs_rows(log_dir):
+    other = "d,2026-01-02,s@example.com,z@example.com,relayed,2.0.0,250 ok,0123456789ab,c,<m9>\n"
+    (log_dir / "acct-1.csv").write_text(_SAMPLE + other, encoding="utf-8")
+
+    payload = bridge._pull_accounting(_FakeRequest({"x-job-id": "ABCDEF123456"}), kind="acct", max_lines=3)
+
+    assert payload["job_id"] == "abcdef123456"
+    assert payload["count"] == 3
+    assert {ev["job_id"] for ev in payload["events"]} == {"abcdef123456"}
+
+
+def test_jobs_count_scans_once_for_several_jobs(log_dir):
+    (log_dir / "acct-1.csv").write_text(_SAMPLE, encoding="utf-8")
+
+    payload = bridge.get_jobs_count(job_ids="abcdef123456, 0123456789ab", _=None)
+
+    assert list(payload["jobs"]) == ["abcdef123456", "0123456789ab"]
+    assert payload["jobs"]["abcdef123456"] == {
+        k: v for k, v in bridge.get_job_count(job_id="abcdef123456", _=None).items() if k != "ok"
+    }
+    assert payload["jobs"]["abcdef123456"]["linked_emails_count"] == 4
+    assert payload["jobs"]["0123456789ab"]["linked_emails_count"] == 0
+
+    outcomes = bridge.get_job_outcomes(job_id="abcdef123456", _=None)
+    counts = payload["jobs"]["abcdef123456"]
+    for outcome in ("delivered", "deferred", "bounced", "complained"):
+        assert counts[outcome + "_count"] == outcomes[outcome]["count"]
+
+
+def test_job_outcomes_render_through_orjson(log_dir):
+    orjson = pytest.importorskip("orjson")
+    (log_dir / "acct-1.csv").write_text(_SAMPLE, encoding="utf-8")
+
+    payload = bridge.get_job_outcomes(job_id="abcdef123456", _=None)
+
+    assert orjson.loads(bridge._OrjsonResponse(content={}).render(payload)) == payload
+
+
+def test_normalize_outcome_type_exact_and_substring_matches():
+    assert bridge._normalize_outcome_type(" D ") == "delivered"
+    assert bridge._normalize_outcome_type("hardbounce") == "bounced"
+    assert bridge._normalize_outcome_type("deferral") == "deferred"
+    assert bridge._normalize_outcome_type("FBL") == "complained"
+    assert bridge._normalize_outcome_type("smtp; 550 5.1.1 user unknown") == "bounced"
+    assert bridge._normalize_outcome_type("451 4.7.1 try later") == "deferred"
+    assert bridge._normalize_outcome_type("???") == ""
+
+
+def test_file_listing_skips_symlinks_dirs_and_unmatched_names(log_dir):
+    (log_dir / "acct-1.csv").write_text("a\n", encoding="utf-8")
+    (log_dir / "acct-2.csv").write_text("bb\n", encoding="utf-8")
+    (log_dir / "diag-1.csv").write_text("x\n", encoding="utf-8")
+    (log_dir / "acct-dir.csv").mkdir()
+    (log_dir / "acct-link.csv").symlink_to(log_dir / "acct-1.csv")
+    bridge.os.utime(log_dir / "acct-1.csv", (1_700_000_000, 1_700_000_000))
+
+    names = sorted(x["name"] for x in bridge.list_dir_files(["acct-*.csv"]))
+    assert names == ["acct-1.csv", "acct-2.csv"]
+    assert [p.name for p in bridge._find_matching_files(["acct-*.csv"])] == ["acct-2.csv", "acct-1.csv"]
+    assert bridge._find_latest_file(["acct-*.csv"]).name == "acct-2.csv"
+
+
+def test_file_listing_is_reused_within_ttl(log_dir, monkeypatch):
+    (log_dir / "acct-1.csv").write_text("a\n", encoding="utf-8")
+    monkeypatch.setattr(bridge, "DIR_LISTING_TTL_SECONDS", 60)
+
+    assert [x["name"] for x in bridge.list_dir_files(["acct-*.csv"])] == ["acct-1.csv"]
+    (log_dir / "acct-2.csv").write_text("b\n", encoding="utf-8")
+    assert [x["name"] for x in bridge.list_dir_files(["acct-*.csv"])] == ["acct-1.csv"]
+    assert len(bridge._scan_matching_files(["acct-*.csv"])) == 2
+
+    monkeypatch.setattr(bridge, "DIR_LISTING_TTL_SECONDS", 0)
+    assert len(bridge.list_dir_files(["acct-*.csv"])) == 2
+
+
+def test_files_removed_within_listing_ttl_are_skipped(log_dir, monkeypatch):
+    (log_dir / "acct-1.csv").write_text(_SAMPLE, encoding="utf-8")
+    (log_dir / "acct-2.csv").write_text(_SAMPLE, encoding="utf-8")
+    monkeypatch.setattr(bridge, "DIR_LISTING_TTL_SECONDS", 60)
+
+    assert len(bridge.list_dir_files(["acct-*.csv"])) == 2
+    (log_dir / "acct-2.csv").unlink()
+
+    counts = bridge.get_jobs_count(job_ids="abcdef123456", _=None)
+    assert counts["jobs"]["abcdef123456"]["linked_emails_count"] == 4
+    assert not bridge._DIR_LISTING_CACHE
+
+    assert len(bridge.list_dir_files(["acct-*.csv"])) == 1
+    (log_dir / "acct-1.csv").unlink()
+    (log_dir / "acct-3.csv").write_text(_SAMPLE, encoding="utf-8")
+    assert bridge._pull_accounting(_FakeRequest(), kind="acct", max_lines=3)["count"] == 3
+
+    assert len(bridge.list_dir_files(["acct-*.csv"])) == 1
+    (log_dir / "acct-3.csv").unlink()
+    payload = bridge._pull_accounting(_FakeRequest({"x-job-id": "abcdef123456"}), kind="acct", max_lines=3)
+    assert payload["count"] == 0
+
+
+def test_file_matches_uses_combined_glob_patterns():
+    patterns = bridge.ALLOWED_KINDS["all"]
+    assert bridge._file_matches("acct-2026.csv", patterns)
+    assert bridge._file_matches("log", patterns)
+    assert bridge._file_matches("pmtahttp.log.1", patterns)
+    assert not bridge._file_matches("acct-2026.csv.gz", ["acct-*.csv"])
+    assert not bridge._file_matches("logfile", patterns)
+    assert not bridge._file_matches("acct-1.csv", [])
+    assert not bridge._file_matches("acct-1.csv.lock", ["acct-*.csv", "log"])
+    assert not bridge._file_matches("xacct-1.csv", ["acct-*.csv"])
+    assert bridge._file_matches("acct-5.csv", ["acct-[0-9].csv"])
+    assert bridge._file_matches("log.1", ["log[.]1"])
+    assert not bridge._file_matches("acct-x.csv", ["acct-[0-9].csv"])
+
+
+def test_partial_trailing_row_is_left_for_next_read(tmp_path):
+    fp = tmp_path / "acct-1.csv"
+    fp.write_text("type,rcpt\nd,a@example.com\nd,b@exa", encoding="utf-8")
+    bridge._CSV_HEADER_STATE.clear()
+
+    st = fp.stat()
+    files = [{"name": fp.name, "path": str(fp), "inode": st.st_ino, "size": st.st_size, "mtime": st.st_mtime}]
+    first = bridge._read_from_cursor(files, {"path": str(fp), "inode": st.st_ino, "offset": 0}, 10)
+    assert [ev["rcpt"] for ev in first["items"]] == ["a@example.com"]
+    assert first["has_more"] is False
+
+    with fp.open("a", encoding="utf-8") as f:
+        f.write("mple.com\n")
+    st = fp.stat()
+    files[0]["size"] = st.st_size
+    second = bridge._read_from_cursor(files, bridge._decode_cursor(first["next_cursor"]), 10)
+    assert [ev["rcpt"] for ev in second["items"]] == ["b@example.com"]
+
+
+def test_cursor_read_restarts_after_truncate(tmp_path):
+    fp = tmp_path / "acct-1.csv"
+    fp.write_text("type,rcpt\nd,a@example.com\nd,b@example.com\n", encoding="utf-8")
+    bridge._CSV_HEADER_STATE.clear()
+
+    def listed():
+        st = fp.stat()
+        return [{"name": fp.name, "path": str(fp), "inode": st.st_ino, "size": st.st_size, "mtime": st.st_mtime}]
+
+    first = bridge._read_from_cursor(listed(), None, 10)
+    assert [ev["rcpt"] for ev in first["items"]] == ["a@example.com", "b@example.com"]
+
+    with fp.open("r+", encoding="utf-8") as f:
+        f.truncate(0)
+        f.write("type,rcpt\nd,c@example.com\n")
+    second = bridge._read_from_cursor(listed(), bridge._decode_cursor(first["next_cursor"]), 10)
+    assert [ev["rcpt"] for ev in second["items"]] == ["c@example.com"]
+    assert bridge._decode_cursor(second["next_cursor"])["offset"] == fp.stat().st_size
+
+
+def test_line_format_is_detected_once_per_file():
+    bridge._CSV_HEADER_STATE.clear()
+    bridge._LINE_FORMAT_STATE.clear()
+    assert bridge._parse_accounting_line("type\trcpt\tdsnDiag", source_file="acct-tab.csv") is None
+
+    ev = bridge._parse_accounting_line("b\tc@example.com\t550 no, such, user", source_file="acct-tab.csv")
+    assert ev["rcpt"] == "c@example.com"
+    assert ev["dsndiag"] == "550 no, such, user"
+
+    obj = bridge._parse_accounting_line('{"type": "d", "rcpt": "j@example.com"}', source_file="acct-json.csv")
+    assert obj["rcpt"] == "j@example.com"
+    assert bridge._LINE_FORMAT_STATE == {"acct-tab.csv": "\t", "acct-json.csv": "json"}
+
+
+def test_line_format_is_detected_again_after_rotation(tmp_path):
+    fp = tmp_path / "acct-1.csv"
+    fp.write_text("type,rcpt\nd,a@example.com\n", encoding="utf-8")
+
+    def listed():
+        st = fp.stat()
+        return [{"name": fp.name, "path": str(fp), "inode": st.st_ino, "size": st.st_size, "mtime": st.st_mtime}]
+
+    first = bridge._read_from_cursor(listed(), None, 10)
+    assert [ev["rcpt"] for ev in first["items"]] == ["a@example.com"]
+    assert bridge._LINE_FORMAT_STATE == {"acct-1.csv": ","}
+
+    fp.rename(tmp_path / "acct-1.csv.1")
+    fp.write_text('{"type": "d", "rcpt": "j@example.com"}\n', encoding="utf-8")
+    second = bridge._read_from_cursor(listed(), bridge._decode_cursor(first["next_cursor"]), 10)
+    assert [ev["rcpt"] for ev in second["items"]] == ["j@example.com"]
+    assert bridge._LINE_FORMAT_STATE == {"acct-1.csv": "json"}
+
+
+def test_job_recipients_match_between_serial_and_worker_scans(log_dir, monkeypatch):
+    header = _SAMPLE.splitlines()[0]
+    (log_dir / "acct-1.csv").write_text(_SAMPLE, encoding="utf-8")
+    (log_dir / "acct-2.csv").write_text(
+        header + "\nd,2026-01-02,s@example.com,b@example.com,relayed,2.0.0,250 ok,abcdef123456,c,<m9>\n",
+        encoding="utf-8",
+    )
+    bridge.os.utime(log_dir / "acct-1.csv", (1_700_000_000, 1_700_000_000))
+
+    serial = bridge._collect_job_recipients(["abcdef123456"])
+    bridge._JOB_RESULT_CACHE.clear()
+    bridge._JOB_SCAN_STATE.clear()
+    monkeypatch.setattr(bridge, "ACCOUNTING_SCAN_WORKERS", 2)
+    parallel = bridge._collect_job_recipients(["abcdef123456"])
+
+    assert parallel == serial
+    assert len(serial["abcdef123456"]) == 4
+    assert serial["abcdef123456"]["b@example.com"][:2] == ("delivered", "<m9>")
+
+    with (log_dir / "acct-2.csv").open("a", encoding="utf-8") as f:
+        f.write("b,2026-01-03,s@example.com,b@example.com,failed,5.1.1,550 no,abcdef123456,c,<m10>\n")
+    resumed = bridge._collect_job_recipients(["abcdef123456"])
+    assert resumed["abcdef123456"]["b@example.com"][:2] == ("bounced", "<m10>")
+    assert {k: v for k, v in resumed["abcdef123456"].items() if k != "b@example.com"} == {
+        k: v for k, v in serial["abcdef123456"].items() if k != "b@example.com"
+    }
+
+
+def test_job_recipients_fall_back_in_process_when_pool_breaks(log_dir, monkeypatch):
+    (log_dir / "acct-1.csv").write_text(_SAMPLE, encoding="utf-8")
+    (log_dir / "acct-2.csv").write_text(_SAMPLE.splitlines()[0] + "\n", encoding="utf-8")
+    monkeypatch.setattr(bridge, "ACCOUNTING_SCAN_WORKERS", 2)
+
+    class _BrokenPool:
+        def map(self, *args):
+            raise bridge.BrokenProcessPool("worker died")
+
+        def shutdown(self, wait=True, cancel_futures=False):
+            pass
+
+    monkeypatch.setattr(bridge, "_SCAN_POOL", _BrokenPool())
+    recipients = bridge._collect_job_recipients(["abcdef123456"])
+    assert len(recipients["abcdef123456"]) == 4
+    assert bridge._SCAN_POOL is None
+
+
+def test_event_value_resolves_aliases_exact_then_substring():
+    ev = {"Dsn_Status": "", "dsnStatus": "5.1.1", "header_Message-ID": "<m1>", "msgid": "<m2>", "x": " "}
+    idx = bridge._EventIndex(ev)
+    for names, expected in (
+        (("dsnStatus", "dsn_status"), "5.1.1"),
+        (("msgid", "message-id"), "<m2>"),
+        (("header_message-id", "msgid"), "<m1>"),
+        (("message",), "<m1>"),
+        (("x",), ""),
+        (("",), ""),
+    ):
+        assert idx.value(*names) == expected
+        assert bridge._event_value(ev, *names) == expected
+    assert bridge._event_value(idx, "msgid", "message-id") == "<m2>"
+    assert bridge._EventIndex(dict(ev)).layout is idx.layout
+    assert idx.layout.plan(("msgid", "message-id")) == ("msgid", "header_Message-ID", "msgid")
+
+
+def test_job_recipients_cache_follows_file_changes(log_dir):
+    fp = log_dir / "acct-1.csv"
+    fp.write_text(_SAMPLE, encoding="utf-8")
+
+    first = bridge._collect_job_recipients(["abcdef123456"], details=False)
+    assert bridge._collect_job_recipients(["abcdef123456"], details=False) is first
+
+    with fp.open("a", encoding="utf-8") as f:
+        f.write("d,2026-01-02,s@example.com,z@example.com,relayed,2.0.0,250 ok,abcdef123456,c,<m9>\n")
+    again = bridge._collect_job_recipients(["abcdef123456"], details=False)
+    assert again is not first
+    assert len(again["abcdef123456"]) == len(first["abcdef123456"]) + 1
+    (_, latest), = bridge._JOB_RESULT_CACHE.values()
+    assert latest is again
+
+
+def test_job_recipients_resume_from_previous_scan_offset(log_dir):
+    fp = log_dir / "acct-1.csv"
+    fp.write_text(_SAMPLE + "d,2026-01-02,s@example.com,y@example.com,relayed,2.0.0,250 ok,abcdef12", encoding="utf-8")
+
+    first = bridge._collect_job_recipients(["abcdef123456"])["abcdef123456"]
+    assert len(first) == 4
+    (_, _, _, _, jobs), = bridge._JOB_SCAN_STATE.values()
+    ((offset, _),) = jobs.values()
+    assert offset == len(_SAMPLE.encode("utf-8"))
+
+    with fp.open("a", encoding="utf-8") as f:
+        f.write("3456,c,<m8>\nb,2026-01-02,s@example.com,a@example.com,failed,5.1.1,550 no,abcdef123456,c,<m9>")
+    bridge._CSV_HEADER_STATE.clear()
+    again = bridge._collect_job_recipients(["abcdef123456"])["abcdef123456"]
+    bridge._JOB_SCAN_STATE.clear()
+    bridge._JOB_RESULT_CACHE.clear()
+    assert again == bridge._collect_job_recipients(["abcdef123456"])["abcdef123456"]
+    assert again["y@example.com"][:2] == ("delivered", "<m8>")
+    assert again["a@example.com"][:2] == ("bounced", "<m9>")
+
+
+def test_job_scan_state_is_shared_by_job_sets_per_file(log_dir, monkeypatch):
+    (log_dir / "acct-1.csv").write_text(_SAMPLE, encoding="utf-8")
+
+    single = bridge._collect_job_recipients(["abcdef123456"], details=False)
+    both = bridge._collect_job_recipients(["abcdef123456", "0123456789ab"], details=False)
+    assert both["abcdef123456"] == single["abcdef123456"]
+    (_, _, _, _, jobs), = bridge._JOB_SCAN_STATE.values()
+    assert set(jobs) == {("abcdef123456", False), ("0123456789ab", False)}
+
+    heads = []
+    monkeypatch.setattr(bridge, "_file_head", lambda path: heads.append(path) or b"")
+    bridge._JOB_RESULT_CACHE.clear()
+    assert bridge._collect_job_recipients(["0123456789ab"], details=False) == {"0123456789ab": both["0123456789ab"]}
+    assert heads == []
+
+
+def test_unknown_outcomes_are_logged_first_and_then_every_nth(tmp_path, monkeypatch, caplog):
+    rows = ["type,rcpt,header_x-job-id"] + ["x,u{}@example.com,abcdef123456".format(i) for i in range(5)]
+    (tmp_path / "acct-1.csv").write_text("\n".join(rows) + "\n", encoding="utf-8")
+    monkeypatch.setattr(bridge, "_UNKNOWN_OUTCOME_SEEN", itertools.count(1))
+    monkeypatch.setattr(bridge, "UNKNOWN_OUTCOME_LOG_EVERY", 2)
+
+    with caplog.at_level(logging.WARNING, logger=bridge.__name__):
+        bridge._collect_file_job_recipients(str(tmp_path / "acct-1.csv"), ("abcdef123456",), False)
+    assert [r.args[0] for r in caplog.records] == [1, 2, 4]
+    assert caplog.records[0].getMessage().endswith("offset={}".format(len(rows[0]) + 1))
+
+
+def test_job_scan_byte_screen_keeps_header_and_mixed_case_ids(tmp_path):
+    (tmp_path / "acct-1.csv").write_text(
+        "type,rcpt,header_x-job-id\n"
+        "d,a@example.com,ABCDEF123456\n"
+        "d,b@example.com,0123456789ab\n"
+        "b,c@example.com,abcdef123456\n",
+        encoding="utf-8",
+    )
+    bridge._CSV_HEADER_STATE.clear()
+    end, complete, tail = bridge._collect_file_job_recipients(
+        str(tmp_path / "acct-1.csv"), ("abcdef123456",), False
+    )
+    assert tail == {"abcdef123456": {}}
+    assert end == (tmp_path / "acct-1.csv").stat().st_size
+    assert {k: v[0] for k, v in complete["abcdef123456"].items()} == {
+        "a@example.com": "delivered",
+        "c@example.com": "bounced",
+    }
+
+
+def test_job_scan_byte_screen_keeps_a_header_after_line_one(log_dir):
+    (log_dir / "acct-1.csv").write_text(
+        "d,x@example.com,abcdef123456\n"
+        "header_x-job-id,type,rcpt\n"
+        "abcdef123456,b,a@example.com\n"
+        "0123456789ab,d,b@example.com\n",
+        encoding="utf-8",
+    )
+
+    for jids in (("abcdef123456",), ("abcdef123456", "0123456789ab")):
+        bridge._CSV_HEADER_STATE.clear()
+        _, complete, _ = bridge._collect_file_job_recipients(str(log_dir / "acct-1.csv"), jids, False)
+        assert complete["abcdef123456"]["a@example.com"][0] == "bounced"
+
+    payload = bridge._pull_accounting(_FakeRequest({"x-job-id": "abcdef123456"}), kind="acct", max_lines=10)
+    assert [ev["rcpt"] for ev in payload["events"]] == ["a@example.com"]
+
+
+def test_get_files_pages_match_a_full_sort(log_dir):
+    for i, size in enumerate([3, 1, 4, 1, 5, 9, 2, 6]):
+        (log_dir / "acct-{}.csv".format(i)).write_text("x" * size, encoding="utf-8")
+
+    for order in ("asc", "desc"):
+        everything = bridge.get_files(kind="acct", sort="size", order=order, limit=100, _=None)["items"]
+        assert len(everything) == 8
+        page = bridge.get_files(kind="acct", sort="size", order=order, limit=3, offset=2, _=None)
+        assert page["total"] == 8
+        assert page["items"] == everything[2:5]
+
+
+def test_job_recipients_rescan_after_copytruncate(log_dir):
+    header = _SAMPLE.splitlines()[0]
+    fp = log_dir / "acct-1.csv"
+    fp.write_text(_SAMPLE, encoding="utf-8")
+    assert len(bridge._collect_job_recipients(["abcdef123456"])["abcdef123456"]) == 4
+
+    # Same inode, new content that has already grown past the previous offset.
+    rows = ["d,2026-02-01,s@example.com,n{}@example.com,relayed,2.0.0,250 ok,abcdef123456,c,<n{}>".format(i, i) for i in range(12)]
+    with fp.open("r+", encoding="utf-8") as f:
+        f.truncate(0)
+        f.write(header + "\n" + "\n".join(rows) + "\n")
+    assert fp.stat().st_size > len(_SAMPLE.encode("utf-8"))
+
+    again = bridge._collect_job_recipients(["abcdef123456"])["abcdef123456"]
+    assert sorted(again) == sorted("n{}@example.com".format(i) for i in range(12))
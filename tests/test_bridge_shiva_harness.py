@@ -21,6 +21,8 @@ class BridgeShivaHarnessTests(unittest.TestCase):
         shiva.db_clear_all()
         shiva.JOBS.clear()
         shiva._OUTCOME_CACHE.clear()
+        bridge._CSV_HEADER_STATE.clear()
+        bridge._LINE_FORMAT_STATE.clear()
 
     def _prepare_job(self, job_id: str = "abcdef123456"):
         job = shiva.SendJob(id=job_id, created_at=shiva.now_iso(), campaign_id="camp001")
@@ -151,6 +153,23 @@ class BridgeShivaHarnessTests(unittest.TestCase):
         finally:
             shiva.BRIDGE_MODE = old_mode
 
+    def test_bridge_cursor_is_saved_again_after_switching_database(self):
+        old_mode, old_path = shiva.BRIDGE_MODE, shiva.DB_PATH
+        try:
+            shiva.BRIDGE_MODE = "legacy"
+            shiva._db_set_bridge_cursor("cursor-1")
+            self.assertEqual(shiva._db_get_bridge_cursor(), "cursor-1")
+            with TemporaryDirectory() as td:
+                shiva.DB_PATH = str(Path(td) / "other.db")
+                shiva.db_init()
+                self.assertEqual(shiva._db_get_bridge_cursor(), "")
+                shiva._db_set_bridge_cursor("cursor-1")
+                self.assertEqual(shiva._db_get_bridge_cursor(), "cursor-1")
+        finally:
+            shiva.BRIDGE_MODE = old_mode
+            shiva.DB_PATH = old_path
+            shiva.db_init()
+
     def test_learning_logs_and_updates_pair_stats(self):
         shiva.db_log_email_attempt(
             job_id="abcdef123456",
@@ -507,6 +526,113 @@ class BridgeShivaHarnessTests(unittest.TestCase):
                 os.environ["SHIVA_HOST"] = old_host
 
 
+    def test_bridge_poller_batches_job_counts_for_multiple_jobs(self):
+        old_port = shiva.PMTA_BRIDGE_PULL_PORT
+        old_host = os.environ.get("SHIVA_HOST")
+        old_fetch_outcomes = shiva.BRIDGE_POLL_FETCH_OUTCOMES
+
+        seen = []
+
+        def _fake_bridge_get_json(path, params):
+            seen.append(path)
+            if path == "/api/v1/jobs/count":
+                jids = str(params.get("job_ids") or "").split(",")
+                return {
+                    "ok": True,
+                    "jobs": {
+                        jid: {"job_id": jid, "linked_emails_count": 2, "delivered_count": 2}
+                        for jid in jids
+                    },
+                }
+            raise AssertionError("unexpected path: {}".format(path))
+
+        try:
+            os.environ["SHIVA_HOST"] = "194.116.172.135"
+            shiva.PMTA_BRIDGE_PULL_PORT = 18090
+            shiva.BRIDGE_POLL_FETCH_OUTCOMES = False
+            shiva._BRIDGE_JOBS_COUNT_UNSUPPORTED.clear()
+            first = self._prepare_job("abcdef123456")
+            second = self._prepare_job("abcdef654321")
+            first.status = second.status = "running"
+
+            old_bridge_get_json = shiva.bridge_get_json
+            shiva.bridge_get_json = _fake_bridge_get_json
+            result = shiva._poll_accounting_bridge_once()
+
+            self.assertTrue(result["ok"])
+            self.assertEqual(seen, ["/api/v1/jobs/count"])
+            self.assertEqual(first.delivered, 2)
+            self.assertEqual(second.delivered, 2)
+        finally:
+            shiva.bridge_get_json = old_bridge_get_json
+            shiva.BRIDGE_POLL_FETCH_OUTCOMES = old_fetch_outcomes
+            shiva.PMTA_BRIDGE_PULL_PORT = old_port
+            if old_host is None:
+                os.environ.pop("SHIVA_HOST", None)
+            else:
+                os.environ["SHIVA_HOST"] = old_host
+
+    def test_bridge_get_json_tolerates_invalid_utf8(self):
+        class _Resp:
+            status = 200
+            will_close = False
+
+            def read(self):
+                return b'{"ok": true, "reason": "caf\xe9"}'
+
+            def getheader(self, name):
+                return ""
+
+        class _Conn:
+            def request(self, *args, **kwargs):
+                pass
+
+            def getresponse(self):
+                return _Resp()
+
+        old_connection, old_base = shiva._bridge_http_connection, shiva.BRIDGE_BASE_URL
+        try:
+            shiva._bridge_http_connection = lambda host, port, timeout_s: _Conn()
+            shiva.BRIDGE_BASE_URL = "http://127.0.0.1:18090"
+            obj = shiva.bridge_get_json("/api/v1/status", {})
+            self.assertTrue(obj["ok"])
+            self.assertEqual(obj["reason"], "caf\ufffd")
+        finally:
+            shiva._bridge_http_connection = old_connection
+            shiva.BRIDGE_BASE_URL = old_base
+
+    def test_bridge_jobs_count_backs_off_only_when_endpoint_is_missing(self):
+        base_url = "http://127.0.0.1:18090"
+        errors = []
+
+        def _fake_bridge_get_json(path, params):
+            raise errors[0]
+
+        old_bridge_get_json = shiva.bridge_get_json
+        try:
+            shiva.bridge_get_json = _fake_bridge_get_json
+            shiva._BRIDGE_JOBS_COUNT_UNSUPPORTED.clear()
+
+            errors[:] = [RuntimeError("bridge_http_status=503 body=b'busy'")]
+            self.assertEqual(shiva._bridge_fetch_job_counts(base_url, {}, ["abcdef123456", "abcdef654321"]), {})
+            errors[:] = [TimeoutError("timed out")]
+            self.assertEqual(shiva._bridge_fetch_job_counts(base_url, {}, ["abcdef123456", "abcdef654321"]), {})
+            self.assertNotIn(base_url, shiva._BRIDGE_JOBS_COUNT_UNSUPPORTED)
+
+            no_files = '{"ok":false,"error":"http_error","detail":{"message":"No accounting/log files matched"}}'
+            errors[:] = [RuntimeError(f"bridge_http_status=404 body={no_files!r}")]
+            counts = shiva._bridge_fetch_job_counts(base_url, {}, ["abcdef123456", "abcdef654321"])
+            self.assertEqual(sorted(counts), ["abcdef123456", "abcdef654321"])
+            self.assertEqual(counts["abcdef123456"]["linked_emails_count"], 0)
+            self.assertNotIn(base_url, shiva._BRIDGE_JOBS_COUNT_UNSUPPORTED)
+
+            errors[:] = [RuntimeError("bridge_http_status=404 body='{\"detail\":\"Not Found\"}'")]
+            self.assertEqual(shiva._bridge_fetch_job_counts(base_url, {}, ["abcdef123456", "abcdef654321"]), {})
+            self.assertGreater(shiva._BRIDGE_JOBS_COUNT_UNSUPPORTED[base_url], time.time())
+        finally:
+            shiva.bridge_get_json = old_bridge_get_json
+            shiva._BRIDGE_JOBS_COUNT_UNSUPPORTED.clear()
+
     def test_bridge_poller_replaces_counters_from_job_count_authoritatively(self):
         old_port = shiva.PMTA_BRIDGE_PULL_PORT
         old_host = os.environ.get("SHIVA_HOST")